@@ -0,0 +1,134 @@
+"""FrameDecoder 검증 + 벤치마크
+
+먼저 경계 상황에서 꺼낸 패킷과 카운터가 기대와 같은지 검증하고 (하나라도 다르면 종료),
+그다음 메시지 구성별로 패킷당 분리 시간을 비교합니다.
+
+검증 항목:
+- multi    : 한 메시지에 여러 패킷
+- split    : 패킷이 여러 메시지로 잘려 옴 (스트림의 모든 위치에서 잘라 봄)
+- escape   : 0x1B 바로 뒤에서 잘림 (MAGIC이 두 메시지에 걸침)
+- corrupt  : 깨진 구간을 다음 MAGIC까지 건너뜀
+- overflow : MAX_BUFFER를 넘는 미완성 패킷은 버리고 다음 패킷부터 정상 분리
+
+벤치마크:
+- single   : 메시지 하나 = 패킷 하나 (빠른 경로)
+- batched  : 메시지 하나에 패킷 10개
+- split    : 패킷마다 두 메시지로 잘려 옴
+
+사용법:
+    python benchmarks/bench_frame_decoder.py
+    python benchmarks/bench_frame_decoder.py --frames 200000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from soopchat import frame as frame_module
+from soopchat.frame import FrameDecoder, MAGIC
+from soopchat.constants import SVC_CHATMESG, SVC_SENDBALLOON, SVC_KEEPALIVE
+from soopchat.packets import encode_packet
+from soopchat.synthetic import SyntheticFrames
+
+CHAT = encode_packet(SVC_CHATMESG, ("안녕하세요", "viewer1(2)", "0", "1", "0", "별빛나는밤", "524288|0", "3", "0", ""))
+BALLOON = encode_packet(SVC_SENDBALLOON, ("streamer", "viewer1", "별빛나는밤", "100", "0", "0", "1", "", "0", ""))
+KEEPALIVE = encode_packet(SVC_KEEPALIVE, ())
+STREAM = [CHAT, BALLOON, KEEPALIVE]
+
+
+def decode(messages: list[bytes]) -> tuple[list[bytes], FrameDecoder]:
+    decoder = FrameDecoder()
+    packets = []
+    for message in messages:
+        packets += decoder.feed(message)
+    return packets, decoder
+
+
+# ─── 검증 ───
+
+def check(name: str, got, expected):
+    if got != expected:
+        raise SystemExit(f"[{name}] 결과 불일치: {got!r} != {expected!r}")
+
+
+def verify():
+    # 한 메시지에 여러 패킷
+    packets, decoder = decode([b"".join(STREAM)])
+    check("multi", packets, STREAM)
+    check("multi/counters", (decoder.packets, decoder.malformed, decoder.pending), (3, 0, 0))
+
+    # 모든 위치에서 두 메시지로, 그리고 1바이트씩 잘라 보냄
+    data = b"".join(STREAM)
+    for cut in range(1, len(data)):
+        packets, decoder = decode([data[:cut], data[cut:]])
+        check(f"split@{cut}", packets, STREAM)
+        check(f"split@{cut}/malformed", decoder.malformed, 0)
+    packets, decoder = decode([data[i:i + 1] for i in range(len(data))])
+    check("split/bytewise", packets, STREAM)
+    check("split/bytewise/pending", decoder.pending, 0)
+
+    # 0x1B 바로 뒤에서 잘림: 앞 메시지 끝의 0x1B를 남겼다가 이어 붙임
+    cut = len(CHAT) + 1
+    check("escape/cut", data[cut - 1:cut + 1], MAGIC)
+    packets, decoder = decode([data[:cut], data[cut:]])
+    check("escape", packets, STREAM)
+    check("escape/fragmented", decoder.fragmented, 1)
+    decoder = FrameDecoder()
+    check("escape/pending", (decoder.feed(CHAT + b"\x1b"), decoder.pending), ([CHAT], 1))
+
+    # 깨진 구간은 다음 MAGIC까지 건너뜀 (헤더 자리의 숫자가 아닌 값, MAGIC 없는 쓰레기)
+    broken = MAGIC + b"00x5000010" + b"zz"
+    packets, decoder = decode([b"garbage" + CHAT + broken + BALLOON, b"\x00\x01" + KEEPALIVE])
+    check("corrupt", packets, STREAM)
+    check("corrupt/malformed", decoder.malformed, 3)
+
+    # MAX_BUFFER를 넘는 미완성 패킷은 버리고, 다음 메시지부터 정상 분리
+    limit = frame_module.MAX_BUFFER
+    frame_module.MAX_BUFFER = len(CHAT) - 2
+    try:
+        decoder = FrameDecoder()
+        check("overflow/drop", decoder.feed(CHAT[:-1]), [])
+        check("overflow/pending", (decoder.pending, decoder.malformed), (0, 1))
+        check("overflow/recover", decoder.feed(BALLOON), [BALLOON])
+    finally:
+        frame_module.MAX_BUFFER = limit
+
+
+# ─── 벤치마크 ───
+
+def bench(name: str, messages: list[bytes], packets: int, repeat: int):
+    def run():
+        decoder = FrameDecoder()
+        feed = decoder.feed
+        for message in messages:
+            feed(message)
+        return decoder
+
+    check(f"{name}/count", run().packets, packets)
+    elapsed = min(timeit.repeat(run, number=1, repeat=repeat))
+    print(f"{name:<10}{len(messages):>10}{elapsed / packets * 1e6:>14.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FrameDecoder 검증 + 벤치마크")
+    parser.add_argument("--frames", type=int, default=50000, help="벤치마크 패킷 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    verify()
+    print("검증 통과")
+
+    frames = [packet for _, packet in SyntheticFrames(seed=args.seed).frames(args.frames, user_list=False)]
+    batched = [b"".join(frames[i:i + 10]) for i in range(0, len(frames), 10)]
+    split = [part for packet in frames for part in (packet[:len(packet) // 2], packet[len(packet) // 2:])]
+
+    print(f"{'case':<10}{'messages':>10}{'us/packet':>14}")
+    bench("single", frames, len(frames), args.repeat)
+    bench("batched", batched, len(frames), args.repeat)
+    bench("split", split, len(frames), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
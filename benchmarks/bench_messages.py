@@ -0,0 +1,153 @@
+"""
+parse_* 마이크로벤치마크 (before/after)
+
+before: 소비자마다 프레임 전체를 decode(errors="replace") + split("\\f") 하던 기존 방식
+after : bytes.split(b"\\f")로 필드만 나누고 파서가 읽는 필드만 decode (soopchat.frame)
+
+- parse   : bytes를 파서 하나가 읽는 경우
+- frame   : 수신 루프처럼 Frame으로 감싸 파서에 넘기는 경우 (Frame 생성 비용 포함)
+- shared  : 서비스 코드 확인 + 필터(유저 ID) + 파서가 같은 프레임을 읽는 경우
+- userlist: 모든 필드를 읽는 유저 목록 (전체 decode 경로)
+
+두 방식의 결과가 동일한지 먼저 검증한 뒤 프레임당 소요 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_messages.py
+    python benchmarks/bench_messages.py --number 200000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from soopchat import messages
+from soopchat.frame import Frame
+from soopchat.constants import SVC_CHATMESG, SVC_SENDBALLOON, SVC_ADCON_EFFECT, SVC_CHUSER
+from soopchat.utils import make_header, remove_parentheses, set_flag, get_service_code, parse_multi_user_list
+from soopchat.types import User, ChatMessage, Balloon, Adballoon
+
+
+def packet(svc: int, fields: list[str]) -> bytes:
+    body = ("\f" + "\f".join(fields) + "\f").encode()
+    return make_header(svc, len(body)) + body
+
+
+CHAT = packet(SVC_CHATMESG, [
+    "오늘 방송 너무 재밌어요 ㅋㅋㅋ", "viewer123(2)", "0", "1", "0",
+    "별빛나는밤", "545392672|163840", "3", "0", "",
+])
+BALLOON = packet(SVC_SENDBALLOON, [
+    "streamer", "viewer123", "별빛나는밤", "100", "0", "0", "1", "", "0", "",
+])
+ADBALLOON = packet(SVC_ADCON_EFFECT, [
+    "streamer", "0", "viewer123", "별빛나는밤", "1", "0", "0", "0", "0", "500", "0", "",
+])
+USER_JOIN = packet(SVC_CHUSER, ["1", "viewer123(2)", "별빛나는밤", "545392672|163840", ""])
+USER_LIST = packet(SVC_CHUSER, ["1"] + [
+    field for i in range(1000) for field in (f"viewer{i}", f"닉네임{i}", "545392672|163840")
+])
+
+
+# ─── before: 기존 구현 (전체 decode + split) ───
+
+def legacy_parse_chat_message(message: bytes) -> ChatMessage:
+    msg = message.decode(errors="replace").split("\f")
+    if len(msg) < 9:
+        raise ValueError("message splitting failure [5]")
+    user_flag = set_flag(msg[7].split("|"))
+    try:
+        sub_month = int(msg[8])
+    except (ValueError, IndexError):
+        sub_month = 0
+    if sub_month == -1:
+        sub_month = 0
+    return ChatMessage(
+        user=User(
+            id=remove_parentheses(msg[2].strip()),
+            name=msg[6].strip(),
+            subscribe_month=sub_month,
+            flag=user_flag,
+        ),
+        message=msg[1].strip(),
+    )
+
+
+def legacy_parse_balloon(message: bytes) -> Balloon:
+    msg = message.decode(errors="replace").split("\f")
+    if len(msg) < 5:
+        raise ValueError("message splitting failure [18]")
+    try:
+        count = int(msg[4])
+    except (ValueError, IndexError):
+        count = 0
+    return Balloon(user=User(id=msg[2], name=msg[3]), count=count)
+
+
+def legacy_parse_adballoon(message: bytes) -> Adballoon:
+    msg = message.decode(errors="replace").split("\f")
+    if len(msg) < 11:
+        raise ValueError("message splitting failure [87]")
+    try:
+        count = int(msg[10])
+    except (ValueError, IndexError):
+        count = 0
+    return Adballoon(user=User(id=msg[3], name=msg[4]), count=count)
+
+
+def legacy_shared_chat(message: bytes):
+    get_service_code(message)
+    user_id = message.decode(errors="replace").split("\f")[2]
+    return user_id, legacy_parse_chat_message(message)
+
+
+def shared_chat(message: bytes):
+    frame = Frame(message)
+    frame.service_code
+    user_id = frame[2]
+    return user_id, messages.parse_chat_message(frame)
+
+
+def legacy_parse_user_list(message: bytes) -> list:
+    return parse_multi_user_list(message.decode(errors="replace").split("\f"))
+
+
+def frame_parse_balloon(message: bytes) -> Balloon:
+    return messages.parse_balloon(Frame(message))
+
+
+def frame_parse_chat(message: bytes) -> ChatMessage:
+    return messages.parse_chat_message(Frame(message))
+
+
+CASES = [
+    ("parse/chat", CHAT, legacy_parse_chat_message, messages.parse_chat_message),
+    ("parse/balloon", BALLOON, legacy_parse_balloon, messages.parse_balloon),
+    ("parse/adballoon", ADBALLOON, legacy_parse_adballoon, messages.parse_adballoon),
+    ("frame/chat", CHAT, legacy_parse_chat_message, frame_parse_chat),
+    ("frame/balloon", BALLOON, legacy_parse_balloon, frame_parse_balloon),
+    ("shared/chat", CHAT, legacy_shared_chat, shared_chat),
+    ("userlist/1000", USER_LIST, legacy_parse_user_list, messages.parse_user_join),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="soopchat parse_* before/after 벤치마크")
+    parser.add_argument("--number", type=int, default=100000, help="케이스별 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{'case':<20}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, frame, before, after in CASES:
+        if before(frame) != after(frame):
+            raise SystemExit(f"[{name}] 결과 불일치: {before(frame)!r} != {after(frame)!r}")
+        # 큰 프레임(유저 목록)은 크기에 비례해 반복 횟수를 줄임
+        number = max(1, args.number * 300 // max(len(frame), 300))
+        t_before = min(timeit.repeat(lambda: before(frame), number=number, repeat=5))
+        t_after = min(timeit.repeat(lambda: after(frame), number=number, repeat=5))
+        us_before = t_before / number * 1e6
+        us_after = t_after / number * 1e6
+        print(f"{name:<20}{us_before:>14.3f}{us_after:>14.3f}{us_before / us_after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""리플레이 벤치마크 (합성 프레임 또는 녹화 파일)
+
+프레임을 SoopChat의 실제 디스패치/파서 경로로 최대 속도로 재생하고
+서비스 코드별 처리량, 파서/콜백 지연 백분위를 출력합니다.
+--json으로 결과를 저장해 두면 릴리스 간 파서 성능을 비교할 수 있습니다.
+
+사용법:
+    python benchmarks/bench_replay.py
+    python benchmarks/bench_replay.py --frames 500000 --users 20000
+    python benchmarks/bench_replay.py --capture capture.bin --speed 4
+    python benchmarks/bench_replay.py --json result.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from soopchat.replay import Replayer, capture_frames
+from soopchat.synthetic import SyntheticFrames
+
+
+async def run(args) -> dict:
+    if args.capture:
+        frames = capture_frames(args.capture)
+    else:
+        # 생성 비용이 측정에 섞이지 않도록 미리 만들어 둠
+        gen = SyntheticFrames(seed=args.seed, users=args.users)
+        frames = list(gen.frames(args.frames))
+
+    result = await Replayer().replay(frames, speed=args.speed)
+    print(result.format())
+    return result.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="soopchat 리플레이 벤치마크")
+    parser.add_argument("--frames", type=int, default=200000, help="합성 프레임 수")
+    parser.add_argument("--users", type=int, default=5000, help="합성 유저 수 (첫 유저 목록 크기)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--capture", help="녹화 파일 경로 (지정 시 합성 대신 사용)")
+    parser.add_argument("--speed", type=float, default=None, help="녹화 간격 배속 (생략 시 최대 속도)")
+    parser.add_argument("--json", help="요약을 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
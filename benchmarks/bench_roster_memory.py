@@ -0,0 +1,111 @@
+"""
+SVC_CHUSER 최초 유저 목록 메모리 벤치마크
+
+합성한 50k 유저 SVC_CHUSER 프레임을 parse_user_join으로 파싱한 뒤
+결과 리스트가 붙잡고 있는 메모리(retained)와 파싱 중 최대치(peak)를 측정합니다.
+
+before: __slots__ 없는 dataclass + 유저마다 Flag1/Flag2(bool 42개) 중첩 객체
+after : 현재 soopchat.types (slots, 공유 UserFlag, intern 된 ID/닉네임)
+
+사용법:
+    python benchmarks/bench_roster_memory.py
+    python benchmarks/bench_roster_memory.py --users 20000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import make_dataclass, field
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from soopchat.constants import SVC_CHUSER
+from soopchat.messages import parse_user_join
+from soopchat.types import Flag1, Flag2
+from soopchat.utils import make_header
+
+# ─── before: 기존 타입 재현 ───
+
+LegacyFlag1 = make_dataclass("Flag1", [(m.name.lower(), bool, False) for m in Flag1])
+LegacyFlag2 = make_dataclass("Flag2", [(m.name.lower(), bool, False) for m in Flag2])
+LegacyUserFlag = make_dataclass("UserFlag", [
+    ("flag1", LegacyFlag1, field(default_factory=LegacyFlag1)),
+    ("flag2", LegacyFlag2, field(default_factory=LegacyFlag2)),
+])
+LegacyUser = make_dataclass("User", [
+    ("id", str, ""), ("name", str, ""), ("subscribe_month", int, 0),
+    ("flag", LegacyUserFlag, field(default_factory=LegacyUserFlag)),
+])
+LegacyUserList = make_dataclass("UserList", [
+    ("user", LegacyUser, field(default_factory=LegacyUser)), ("status", bool, True),
+])
+
+
+def legacy_flag(value: int, flag_cls, legacy_cls):
+    return legacy_cls(**{m.name.lower(): bool(value & m.value) for m in flag_cls})
+
+
+def legacy_parse_user_join(message: bytes) -> list:
+    msg = message.decode(errors="replace").split("\f")
+    users = []
+    i = 2
+    while i + 2 < len(msg):
+        if msg[i] == "-1":
+            i += 3
+            continue
+        flags = msg[i + 2].split("|")
+        try:
+            f1, f2 = int(flags[0]), int(flags[1])
+        except (ValueError, IndexError):
+            f1, f2 = 0, 0
+        user_flag = LegacyUserFlag(
+            flag1=legacy_flag(f1, Flag1, LegacyFlag1),
+            flag2=legacy_flag(f2, Flag2, LegacyFlag2),
+        )
+        users.append(LegacyUserList(
+            user=LegacyUser(id=msg[i], name=msg[i + 1], flag=user_flag),
+            status=True,
+        ))
+        i += 3
+    return users
+
+
+# ─── 합성 프레임 ───
+
+FLAG_MIX = ["524320|163840", "524288|163840", "524576|163840", "268959776|163840", "557056|0"]
+
+
+def synthetic_user_list(n_users: int) -> bytes:
+    fields = ["1"]
+    for i in range(n_users):
+        fields += [f"viewer{i:06d}", f"시청자{i}", FLAG_MIX[i % len(FLAG_MIX)]]
+    body = ("\f" + "\f".join(fields) + "\f").encode()
+    return make_header(SVC_CHUSER, len(body)) + body
+
+
+def measure(parse, frame: bytes) -> tuple[int, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    result = parse(frame)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(result), retained - base, peak - base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SVC_CHUSER 유저 목록 메모리 벤치마크")
+    parser.add_argument("--users", type=int, default=50000, help="합성 유저 수")
+    args = parser.parse_args()
+
+    frame = synthetic_user_list(args.users)
+    print(f"frame: {len(frame) / 1024:.0f} KiB, users={args.users}")
+    print(f"{'impl':<8}{'users':>8}{'retained (MiB)':>16}{'peak (MiB)':>12}{'B/user':>9}")
+    for name, parse in (("before", legacy_parse_user_join), ("after", parse_user_join)):
+        count, retained, peak = measure(parse, frame)
+        print(f"{name:<8}{count:>8}{retained / 2**20:>16.2f}{peak / 2**20:>12.2f}{retained / count:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
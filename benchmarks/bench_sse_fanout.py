@@ -0,0 +1,114 @@
+"""SSE 팬아웃 벤치마크 (구독자 수별 broadcast 비용)
+
+server/main.py의 AppState.broadcast → event_generator 경로를 두 방식으로 재현해 비교합니다.
+
+- per_subscriber: 이벤트 dict를 큐에 넣고 구독자마다 json.dumps (이전 방식)
+- shared: broadcast에서 한 번만 SSE 프레임(bytes)으로 인코딩해 모든 구독자가 공유 (현재 방식)
+
+이벤트는 별풍선 폭주 때의 구성(log, result, stats 반복 + 가끔 results 전체 목록)을 흉내 냅니다.
+시간은 broadcast부터 모든 구독자가 프레임을 꺼내 전송할 bytes를 얻을 때까지입니다.
+
+사용법:
+    python benchmarks/bench_sse_fanout.py
+    python benchmarks/bench_sse_fanout.py --events 5000 --subscribers 1 3 10 30 100 --results 2000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+def sse_frame(data: dict, event_id: str = "") -> bytes:
+    # server/main.py의 sse_frame과 같은 인코딩
+    body = b"data: " + json.dumps(data, default=str).encode() + b"\n\n"
+    return b"id: " + event_id.encode() + b"\n" + body if event_id else body
+
+
+def make_result(rid: int, rng: random.Random) -> dict:
+    return {
+        "id": rid,
+        "type": rng.choice(("balloon", "adballoon", "mission")),
+        "user_id": f"user{rng.randrange(100000)}",
+        "user_nickname": rng.choice(("별빛나는밤", "꿀벌대장", "하늘바라기", "불꽃소년")),
+        "count": rng.choice((1, 10, 100, 500, 1000)),
+        "title": "",
+        "message": "감사합니다 응원해요" if rng.random() < 0.5 else "",
+        "memo": "",
+        "done": False,
+        "matched_template": "미션",
+        "time": "오후 09:12:34",
+        "timestamp": time.time(),
+    }
+
+
+def make_events(count: int, results: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    history = [make_result(i, rng) for i in range(results)]
+    events = []
+    for i in range(count):
+        result = make_result(results + i, rng)
+        events.append({"event": "log", "data": {"time": result["time"], "message": f"별풍선: {result['user_nickname']} {result['count']}개", "type": "balloon"}})
+        events.append({"event": "result", "data": result})
+        events.append({"event": "stats", "data": {"total": results + i, "in_progress": i, "done": results}})
+        if i % 500 == 499:
+            # 삭제/초기화 때 보내는 전체 목록
+            events.append({"event": "results", "data": history})
+    return events
+
+
+async def per_subscriber(events: list[dict], subscribers: int) -> tuple[float, int]:
+    queues = [asyncio.Queue() for _ in range(subscribers)]
+    sent = 0
+    started = time.perf_counter()
+    for data in events:
+        for q in queues:
+            q.put_nowait(data)
+        for q in queues:
+            sent += len(f"data: {json.dumps(q.get_nowait(), default=str)}\n\n".encode())
+    return time.perf_counter() - started, sent
+
+
+async def shared(events: list[dict], subscribers: int) -> tuple[float, int]:
+    queues = [asyncio.Queue() for _ in range(subscribers)]
+    sent = 0
+    started = time.perf_counter()
+    for i, data in enumerate(events):
+        frame = sse_frame(data, f"bench-{i}")
+        for q in queues:
+            q.put_nowait(frame)
+        for q in queues:
+            sent += len(q.get_nowait())
+    return time.perf_counter() - started, sent
+
+
+async def run(args):
+    events = make_events(args.events, args.results, args.seed)
+    print(f"이벤트 {len(events)}개 (전체 목록 {args.results}건 포함)")
+    print(f"{'구독자':>6} {'per_subscriber':>16} {'shared':>12} {'배율':>7} {'µs/이벤트(shared)':>18}")
+    rows = []
+    for n in args.subscribers:
+        old, old_bytes = await per_subscriber(events, n)
+        new, new_bytes = await shared(events, n)
+        rows.append({"subscribers": n, "per_subscriber_s": old, "shared_s": new})
+        print(f"{n:>6} {old * 1000:>14.1f}ms {new * 1000:>10.1f}ms {old / new:>6.1f}x {new / len(events) * 1e6:>18.1f}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSE 팬아웃 벤치마크")
+    parser.add_argument("--events", type=int, default=2000, help="도네이션 수 (도네이션마다 log/result/stats 3개)")
+    parser.add_argument("--results", type=int, default=1000, help="전체 목록 이벤트의 결과 수")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 3, 10, 30, 100])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    rows = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
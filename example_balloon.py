@@ -5,7 +5,7 @@
 Client ID, Client Secret, OAuth 인증 필요 없음!
 
 사용법:
-    pip install websockets requests
+    pip install websockets aiohttp
     python example_balloon.py
 """
 import asyncio
@@ -5,6 +5,7 @@ SSE로 프론트엔드에 실시간 이벤트 전달
 """
 import asyncio
 import json
+import logging
 import time
 import os
 import io
@@ -14,6 +15,10 @@ import sqlite3
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from contextlib import asynccontextmanager
+from collections import deque
+from itertools import groupby, islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI, Request, Query, Depends, HTTPException
 from fastapi.responses import StreamingResponse, JSONResponse, Response
@@ -26,7 +31,18 @@ from openpyxl.utils import get_column_letter
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from soopchat import SoopChat, Balloon, Adballoon, ChatMessage, Subscription, Mission
-from soopchat.api import ApiService
+from soopchat import ReconnectPolicy, ReconnectInfo, FrameFilter
+from soopchat.api import ApiService, DATA_URL
+from soopchat.constants import SVC_KEEPALIVE, SVC_SENDBALLOON, SVC_CHATMESG
+
+# 최대 50회 연속 실패까지 재연결 (1초부터 지수 증가, 최대 30초, 지터 포함)
+RECONNECT_POLICY = ReconnectPolicy(base_delay=1.0, max_delay=30.0, max_attempts=50)
+
+# 로컬 테스트 서버(python -m soopchat.fakeserver)로 연결할 때만 설정
+SOOP_DATA_URL = os.environ.get("SOOP_DATA_URL", DATA_URL)
+SOOP_CHAT_SCHEME = os.environ.get("SOOP_CHAT_SCHEME", "wss")
+
+logger = logging.getLogger("mission-manager")
 
 
 # ─── 인증 시스템 (SQLite) ───
@@ -39,15 +55,59 @@ if _data_dir:
 else:
     DB_PATH = os.path.join(os.path.dirname(__file__), "auth.db")
 
-def get_db():
-    """DB 연결 반환"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+class Database:
+    """SQLite 연결 하나를 계속 유지하는 저장소
+
+    연결은 전용 스레드 하나에서 열고 그 스레드에서만 사용하므로
+    (sqlite3 기본 check_same_thread 유지) 이벤트 루프는 쿼리/커밋 동안 멈추지 않습니다.
+    WAL + synchronous=NORMAL이라 커밋마다 fsync하지 않고,
+    SQL은 모두 상수 문자열이라 연결의 prepared statement 캐시를 그대로 재사용합니다.
+
+        rows = await db.run(db_load_results)   # 요청 처리 중 (비동기)
+        rows = db.call(db_load_results)        # 시작 시 (동기)
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-8000",     # 약 8MB
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    def __init__(self, path: str, cached_statements: int = 128):
+        self.path = path
+        self.cached_statements = cached_statements
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self.conn: sqlite3.Connection = self.call(self._open)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def call(self, fn, *args):
+        """DB 스레드에서 실행하고 결과를 기다림 (이벤트 루프 밖에서만 사용)"""
+        return self._executor.submit(fn, *args).result()
+
+    async def run(self, fn, *args):
+        """DB 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def close(self):
+        """남은 작업을 마치고 연결 종료"""
+        self._executor.submit(self.conn.close)
+        self._executor.shutdown(wait=True)
+
+
+db = Database(DB_PATH)
+
 
 def init_db():
     """DB 초기화 및 기본 비밀번호 설정"""
-    conn = get_db()
+    conn = db.conn
     c = conn.cursor()
     c.execute("""
         CREATE TABLE IF NOT EXISTS auth (
@@ -95,15 +155,40 @@ def init_db():
         default_hash = hashlib.sha256("lee0421@!".encode()).hexdigest()
         c.execute("INSERT INTO auth (id, password_hash) VALUES (1, ?)", (default_hash,))
     conn.commit()
-    conn.close()
 
-# ─── 템플릿/결과 DB 헬퍼 ───
+# ─── 템플릿/결과 DB 헬퍼 (DB 스레드에서 db.run/db.call로 실행) ───
+
+# 수정 가능한 컬럼 → UPDATE 문 (상수 SQL이라 statement 캐시 재사용, 목록 밖의 키는 무시)
+TEMPLATE_UPDATES = {
+    col: f"UPDATE templates SET {col} = ? WHERE id = ?"
+    for col in ("name", "count", "type", "collect_message", "duration", "started_at", "active")
+}
+
+def _text(val) -> str:
+    return val if isinstance(val, str) else str(val)
+
+# 결과 컬럼 → (변환, 기본값). 쓰기 전에 변환해 값 하나 때문에 묶음 반영이 실패하지 않게 함
+RESULT_COLUMNS = {
+    "type": (_text, ""), "user_id": (_text, ""), "user_nickname": (_text, ""), "count": (int, 0),
+    "title": (_text, ""), "message": (_text, ""), "memo": (_text, ""), "done": (int, 0),
+    "matched_template": (_text, ""), "time": (_text, ""), "timestamp": (float, 0.0),
+}
+RESULT_UPDATES = {col: f"UPDATE results SET {col} = ? WHERE id = ?" for col in RESULT_COLUMNS}
+
+def result_value(col: str, val):
+    """결과 컬럼 값을 DB 타입으로 변환 (변환할 수 없으면 기본값)"""
+    convert, default = RESULT_COLUMNS[col]
+    if val is None:
+        return default
+    try:
+        return convert(val)
+    except (TypeError, ValueError, OverflowError):
+        logger.warning("[DB] 결과 %s 값 %r을 저장할 수 없어 기본값으로 저장합니다", col, val)
+        return default
 
 def db_load_templates():
     """DB에서 템플릿 목록 로드"""
-    conn = get_db()
-    rows = conn.execute("SELECT * FROM templates ORDER BY id").fetchall()
-    conn.close()
+    rows = db.conn.execute("SELECT * FROM templates ORDER BY id").fetchall()
     return [
         {
             "id": r["id"], "name": r["name"], "count": r["count"], "type": r["type"],
@@ -115,41 +200,36 @@ def db_load_templates():
 
 def db_save_template(tmpl: dict) -> int:
     """템플릿 DB 저장, 새 id 반환"""
-    conn = get_db()
+    conn = db.conn
     cur = conn.execute(
         "INSERT INTO templates (name, count, type, collect_message, duration, started_at, active) VALUES (?,?,?,?,?,?,?)",
         (tmpl["name"], tmpl["count"], tmpl["type"], int(tmpl.get("collect_message", False)),
          tmpl.get("duration", 0), tmpl.get("started_at", 0), int(tmpl.get("active", True))),
     )
     conn.commit()
-    new_id = cur.lastrowid
-    conn.close()
-    return new_id
+    return cur.lastrowid
 
 def db_update_template(tmpl_id: int, updates: dict):
     """템플릿 DB 업데이트"""
-    conn = get_db()
+    conn = db.conn
     for key, val in updates.items():
-        if key == "id":
+        sql = TEMPLATE_UPDATES.get(key)
+        if sql is None:
             continue
         if key in ("collect_message", "active"):
             val = int(val)
-        conn.execute(f"UPDATE templates SET {key} = ? WHERE id = ?", (val, tmpl_id))
+        conn.execute(sql, (val, tmpl_id))
     conn.commit()
-    conn.close()
 
 def db_delete_template(tmpl_id: int):
     """템플릿 DB 삭제"""
-    conn = get_db()
+    conn = db.conn
     conn.execute("DELETE FROM templates WHERE id = ?", (tmpl_id,))
     conn.commit()
-    conn.close()
 
 def db_load_results():
     """DB에서 결과 목록 로드"""
-    conn = get_db()
-    rows = conn.execute("SELECT * FROM results ORDER BY id DESC").fetchall()
-    conn.close()
+    rows = db.conn.execute("SELECT * FROM results ORDER BY id DESC").fetchall()
     return [
         {
             "id": r["id"], "type": r["type"], "user_id": r["user_id"],
@@ -161,109 +241,290 @@ def db_load_results():
         for r in rows
     ]
 
-def db_save_result(result: dict) -> int:
-    """결과 DB 저장, 새 id 반환"""
-    conn = get_db()
-    cur = conn.execute(
-        "INSERT INTO results (type, user_id, user_nickname, count, title, message, memo, done, matched_template, time, timestamp) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
-        (result["type"], result["user_id"], result["user_nickname"], result["count"],
-         result["title"], result["message"], result["memo"], int(result.get("done", False)),
-         result["matched_template"], result["time"], result["timestamp"]),
-    )
-    conn.commit()
-    new_id = cur.lastrowid
-    conn.close()
-    return new_id
+RESULT_INSERT = (
+    f"INSERT OR REPLACE INTO results (id, {', '.join(RESULT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(RESULT_COLUMNS) + 1))})"
+)
 
-def db_update_result(rid: int, updates: dict):
-    """결과 DB 업데이트"""
-    conn = get_db()
-    for key, val in updates.items():
-        if key == "id":
-            continue
-        if key == "done":
-            val = int(val)
-        conn.execute(f"UPDATE results SET {key} = ? WHERE id = ?", (val, rid))
-    conn.commit()
-    conn.close()
+# 특정 쓰기의 값 때문에 나는 오류 (다시 해도 같음). 그 밖의 오류(잠금, 디스크 등)는 묶음째 다시 시도
+DB_OP_ERRORS = (
+    sqlite3.IntegrityError, sqlite3.InterfaceError, sqlite3.DataError, sqlite3.ProgrammingError, OverflowError,
+)
 
-def db_delete_result(rid: int):
-    """결과 DB 삭제"""
-    conn = get_db()
-    conn.execute("DELETE FROM results WHERE id = ?", (rid,))
-    conn.commit()
-    conn.close()
+def db_max_result_id() -> int:
+    """지금까지 쓰인 가장 큰 결과 id (AUTOINCREMENT 시퀀스 포함)"""
+    conn = db.conn
+    max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM results").fetchone()[0]
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'results'").fetchone()
+    return max(max_id, row[0] if row else 0)
 
-def db_clear_results():
-    """결과 DB 전체 삭제"""
-    conn = get_db()
-    conn.execute("DELETE FROM results")
-    conn.commit()
-    conn.close()
+def db_apply(ops: list[tuple[str, tuple]]):
+    """쓰기 묶음을 순서대로 한 트랜잭션에 반영 (연속된 같은 SQL은 executemany 한 번)"""
+    conn = db.conn
+    try:
+        for sql, group in groupby(ops, key=itemgetter(0)):
+            conn.executemany(sql, [params for _, params in group])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+def db_apply_each(ops: list[tuple[str, tuple]]) -> list[tuple[tuple[str, tuple], Exception]]:
+    """쓰기를 하나씩 순서대로 반영하고 값 때문에 실패한 쓰기만 (쓰기, 오류)로 반환 (묶음 반영 실패 시)"""
+    conn = db.conn
+    failed = []
+    try:
+        for op in ops:
+            try:
+                conn.execute(*op)
+            except DB_OP_ERRORS as e:
+                failed.append((op, e))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return failed
+
+
+class ResultWriter:
+    """결과 쓰기 지연 반영 (write-behind, group commit)
+
+    결과 id는 메모리에서 바로 발급하므로 DB를 기다리지 않고 바로 broadcast할 수 있습니다.
+    추가/수정/삭제는 순서대로 쌓였다가 interval마다 한 트랜잭션으로 반영됩니다.
+    추가는 id를 지정한 INSERT OR REPLACE라 실패한 묶음을 다시 반영해도 결과가 같습니다.
+    값이 잘못된 쓰기가 섞여 묶음이 실패하면 하나씩 다시 반영해 그 쓰기만 버립니다(dropped).
+    잠금/디스크 오류처럼 묶음 전체가 실패하면 버리지 않고 interval부터 max_delay까지 늘려 가며 다시 시도합니다.
+    close()는 남은 쓰기를 모두 반영한 뒤 돌아옵니다.
+    """
+
+    def __init__(self, db: Database, interval: float = 0.05, max_delay: float = 5.0):
+        self.db = db
+        self.interval = interval
+        self.max_delay = max_delay
+        self._last_id = db.call(db_max_result_id)
+        self._ops: list[tuple[str, tuple]] = []
+        self._retries = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # 지표
+        self.written = 0      # 반영된 쓰기 수
+        self.commits = 0
+        self.failures = 0
+        self.dropped = 0      # 값이 잘못됐거나 종료 중 반영하지 못해 버린 쓰기 수
+
+    def next_id(self) -> int:
+        self._last_id += 1
+        return self._last_id
+
+    def _enqueue(self, sql: str, params: tuple):
+        self._ops.append((sql, params))
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._wakeup.set()
+
+    def insert(self, result: dict):
+        self._enqueue(RESULT_INSERT, (result["id"], *(result_value(col, result.get(col)) for col in RESULT_COLUMNS)))
+
+    def update(self, rid: int, updates: dict):
+        for key, val in updates.items():
+            sql = RESULT_UPDATES.get(key)
+            if sql is None:
+                continue
+            self._enqueue(sql, (result_value(key, val), rid))
+
+    def delete(self, rid: int):
+        self._enqueue("DELETE FROM results WHERE id = ?", (rid,))
+
+    def clear(self):
+        self._enqueue("DELETE FROM results", ())
+
+    async def flush(self):
+        """쌓인 쓰기를 지금 반영 (실패하거나 취소되면 다음 반영 때 앞에서부터 다시 시도)"""
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        failed = []
+        try:
+            try:
+                await self.db.run(db_apply, ops)
+            except DB_OP_ERRORS:
+                # 값이 잘못된 쓰기가 섞임 → 하나씩 다시 반영해 그 쓰기만 버림 (앞뒤 쓰기는 그대로 반영)
+                failed = await self.db.run(db_apply_each, ops)
+        except asyncio.CancelledError:
+            # close()의 취소로 묶음을 잃지 않도록 되돌려 놓음
+            # (DB 스레드에서 이미 반영됐더라도 다시 반영한 결과가 같음)
+            self._ops[:0] = ops
+            raise
+        except Exception:
+            self._ops[:0] = ops
+            self.failures += 1
+            raise
+        for op, e in failed:
+            logger.error("[DB] 결과 쓰기를 반영할 수 없어 버립니다 (%s): %r", e, op)
+        self.dropped += len(failed)
+        self.written += len(ops) - len(failed)
+        self.commits += 1
+        self._retries = 0
+
+    def _drop(self, reason: str):
+        """반영하지 못한 쓰기를 로그로 남기고 버림 (종료 중에만)"""
+        ops, self._ops = self._ops, []
+        self.dropped += len(ops)
+        self._retries = 0
+        logger.error("[DB] %s, 결과 쓰기 %d건을 버립니다: %r", reason, len(ops), ops)
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                self._retries += 1
+                delay = min(self.interval * 2 ** min(self._retries, 16), self.max_delay)
+                logger.warning("[DB] 결과 저장 실패, %.2f초 뒤 다시 시도 (%d회째): %s", delay, self._retries, e)
+                await asyncio.sleep(delay)
+                self._wakeup.set()
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            self._drop(f"종료 중 결과 저장 실패 ({e})")
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._ops),
+            "written": self.written,
+            "commits": self.commits,
+            "failures": self.failures,
+            "dropped": self.dropped,
+        }
 
 
 def verify_password(password: str) -> bool:
     """비밀번호 검증"""
     pw_hash = hashlib.sha256(password.encode()).hexdigest()
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT password_hash FROM auth WHERE id = 1")
-    row = c.fetchone()
-    conn.close()
+    row = db.conn.execute("SELECT password_hash FROM auth WHERE id = 1").fetchone()
     return row is not None and row[0] == pw_hash
 
 def change_password(new_password: str):
     """비밀번호 변경"""
     new_hash = hashlib.sha256(new_password.encode()).hexdigest()
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("UPDATE auth SET password_hash = ? WHERE id = 1", (new_hash,))
+    conn = db.conn
+    conn.execute("UPDATE auth SET password_hash = ? WHERE id = 1", (new_hash,))
     conn.commit()
-    conn.close()
 
 def create_session() -> str:
     """세션 토큰 생성"""
     token = secrets.token_hex(32)
-    conn = get_db()
-    c = conn.cursor()
+    conn = db.conn
     # 오래된 세션 정리 (24시간)
-    c.execute("DELETE FROM sessions WHERE created_at < ?", (time.time() - 86400,))
-    c.execute("INSERT INTO sessions (token, created_at) VALUES (?, ?)", (token, time.time()))
+    conn.execute("DELETE FROM sessions WHERE created_at < ?", (time.time() - 86400,))
+    conn.execute("INSERT INTO sessions (token, created_at) VALUES (?, ?)", (token, time.time()))
     conn.commit()
-    conn.close()
     return token
 
+SESSION_LIFETIME = 86400   # 24시간
+
+def session_expires_at(token: str) -> Optional[float]:
+    """세션 만료 시각, 없는 토큰이면 None"""
+    if not token:
+        return None
+    row = db.conn.execute("SELECT created_at FROM sessions WHERE token = ?", (token,)).fetchone()
+    return None if row is None else row[0] + SESSION_LIFETIME
+
 def validate_session(token: str) -> bool:
     """세션 토큰 검증"""
-    if not token:
-        return False
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT created_at FROM sessions WHERE token = ?", (token,))
-    row = c.fetchone()
-    conn.close()
-    if not row:
-        return False
-    # 24시간 만료
-    return (time.time() - row[0]) < 86400
+    expires_at = session_expires_at(token)
+    return expires_at is not None and time.time() < expires_at
 
 def delete_session(token: str):
     """세션 삭제"""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("DELETE FROM sessions WHERE token = ?", (token,))
+    conn = db.conn
+    conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+    conn.commit()
+
+def delete_other_sessions(token: str):
+    """현재 세션을 제외한 모든 세션 삭제 (비밀번호 변경 시)"""
+    conn = db.conn
+    conn.execute("DELETE FROM sessions WHERE token != ?", (token,))
     conn.commit()
-    conn.close()
+
+
+class SessionCache:
+    """검증된 세션 토큰 → 만료 시각 캐시
+
+    인증이 필요한 요청마다 sessions 테이블을 조회하지 않도록 검증된 토큰만 기억합니다.
+    항목은 ttl초 또는 세션 만료 중 먼저 오는 시각까지 유효하고,
+    로그아웃/비밀번호 변경 시에는 바로 지웁니다. maxsize를 넘으면 가장 오래된 항목부터 밀어냅니다.
+
+    지울 때마다 generation이 올라가고, put은 조회를 시작할 때 읽은 generation이
+    그대로일 때만 저장합니다. DB 조회가 DB 스레드에서 기다리는 동안 로그아웃되면
+    옛 조회 결과로 토큰이 다시 캐시되지 않습니다.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[str, float] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> bool:
+        expires_at = self._entries.get(token)
+        if expires_at is not None:
+            if time.time() < expires_at:
+                self.hits += 1
+                return True
+            del self._entries[token]
+        self.misses += 1
+        return False
+
+    def put(self, token: str, session_expires_at: float, generation: int):
+        if generation != self.generation:
+            return
+        if token not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[token] = min(session_expires_at, time.time() + self.ttl)
+
+    def discard(self, token: str):
+        self.generation += 1
+        self._entries.pop(token, None)
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
 
 # DB 초기화
-init_db()
+db.call(init_db)
+result_writer = ResultWriter(db)
+session_cache = SessionCache()
 
 
 async def require_auth(request: Request):
     """인증 미들웨어 - 쿠키 또는 헤더에서 토큰 확인"""
     token = request.cookies.get("session_token") or request.headers.get("X-Session-Token", "")
-    if not validate_session(token):
+    if not token:
+        return None
+    if session_cache.get(token):
+        return token
+    generation = session_cache.generation
+    expires_at = await db.run(session_expires_at, token)
+    if expires_at is None or time.time() >= expires_at:
         return None
+    session_cache.put(token, expires_at, generation)
     return token
 
 async def auth_guard(request: Request):
@@ -274,17 +535,37 @@ async def auth_guard(request: Request):
     return token
 
 
+# ─── SSE 프레임 ───
+
+SSE_KEEPALIVE = b": keepalive\n\n"
+SSE_RETRY = b"retry: 3000\n\n"     # 브라우저 자동 재연결 간격 (ms)
+SSE_HISTORY_SIZE = 1000             # 재연결 시 다시 보낼 수 있는 최근 이벤트 수
+SSE_HISTORY_BYTES = 4 * 1024 * 1024 # 최근 이벤트 버퍼의 최대 크기 (전체 결과 목록 프레임이 크므로 바이트로도 제한)
+
+def sse_frame(data: dict, event_id: str = "") -> bytes:
+    """SSE 프레임 (id: <event_id>\\ndata: <json>\\n\\n) 인코딩"""
+    body = b"data: " + json.dumps(data, default=str).encode() + b"\n\n"
+    return b"id: " + event_id.encode() + b"\n" + body if event_id else body
+
+
 # ─── 글로벌 상태 ───
 class AppState:
     def __init__(self):
         self.client: Optional[SoopChat] = None
+        self.api = ApiService(data_url=SOOP_DATA_URL, chat_scheme=SOOP_CHAT_SCHEME)  # HTTP 커넥션 풀 (검색/연결 공용)
         self.connected = False
         self.streamer_id = ""
-        self.results: list[dict] = db_load_results()       # DB에서 로드
-        self.templates: list[dict] = db_load_templates()    # DB에서 로드
+        self.results: list[dict] = db.call(db_load_results)     # DB에서 로드
+        self.templates: list[dict] = db.call(db_load_templates)  # DB에서 로드
         self.auto_threshold = 0                # 자동등록 임계값
         self.logs: list[dict] = []             # 실시간 로그 (최대 200개)
-        self.sse_queues: list[asyncio.Queue] = []  # SSE 구독자
+        self.sse_queues: list[asyncio.Queue] = []  # SSE 구독자 (인코딩된 SSE 프레임을 공유)
+        # SSE 이벤트 id = "<서버 실행마다 바뀌는 epoch>-<순번>", 최근 프레임은 링 버퍼에 보관
+        # (개수 SSE_HISTORY_SIZE, 크기 SSE_HISTORY_BYTES 중 먼저 닿는 쪽까지)
+        self.sse_epoch = secrets.token_hex(4)
+        self.sse_event_id = 0
+        self.sse_history: deque[tuple[int, bytes]] = deque()
+        self.sse_history_bytes = 0
         self._task: Optional[asyncio.Task] = None
         self._should_reconnect = False         # 자동 재연결 플래그
 
@@ -299,16 +580,42 @@ class AppState:
             self.logs = self.logs[:200]
         self.broadcast({"event": "log", "data": entry})
 
+    def last_event_id(self) -> str:
+        return f"{self.sse_epoch}-{self.sse_event_id}"
+
     def broadcast(self, data: dict):
+        # 구독자 수와 관계없이 한 번만 직렬화, 모든 구독자가 같은 bytes를 그대로 전송
+        self.sse_event_id += 1
+        frame = sse_frame(data, self.last_event_id())
+        history = self.sse_history
+        history.append((self.sse_event_id, frame))
+        self.sse_history_bytes += len(frame)
+        # 한도를 넘으면 오래된 프레임부터 버림 (한도보다 큰 프레임 하나면 버퍼가 비고,
+        # 그 이전에서 이어 받으려는 클라이언트는 전체 상태를 받음)
+        while history and (len(history) > SSE_HISTORY_SIZE or self.sse_history_bytes > SSE_HISTORY_BYTES):
+            self.sse_history_bytes -= len(history.popleft()[1])
         dead = []
         for q in self.sse_queues:
             try:
-                q.put_nowait(data)
+                q.put_nowait(frame)
             except asyncio.QueueFull:
                 dead.append(q)
         for q in dead:
             self.sse_queues.remove(q)
 
+    def missed_since(self, last_event_id: str) -> Optional[list[bytes]]:
+        """last_event_id 이후 놓친 프레임, 버퍼보다 오래됐거나 다른 실행의 id면 None"""
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.sse_epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        history = self.sse_history
+        oldest = history[0][0] if history else self.sse_event_id + 1
+        if seq > self.sse_event_id or seq < oldest - 1:
+            return None
+        # id가 연속이므로 위치로 바로 건너뜀
+        return [frame for _, frame in islice(history, seq - oldest + 1, None)]
+
     def get_stats(self):
         total = len(self.results)
         done = sum(1 for r in self.results if r.get("done"))
@@ -325,6 +632,9 @@ async def lifespan(app: FastAPI):
     # 종료 시 연결 해제
     if state.client:
         await state.client.disconnect()
+    await state.api.close()
+    await result_writer.close()
+    db.close()
 
 
 app = FastAPI(title="크랙 미션 매니저", lifespan=lifespan)
@@ -343,9 +653,9 @@ app.add_middleware(
 async def login(request: Request):
     body = await request.json()
     password = body.get("password", "")
-    if not verify_password(password):
+    if not await db.run(verify_password, password):
         return JSONResponse({"ok": False, "error": "비밀번호가 틀렸습니다"}, 401)
-    token = create_session()
+    token = await db.run(create_session)
     resp = JSONResponse({"ok": True})
     resp.set_cookie("session_token", token, httponly=True, max_age=86400, samesite="lax")
     return resp
@@ -354,7 +664,9 @@ async def login(request: Request):
 async def logout(request: Request):
     token = request.cookies.get("session_token", "")
     if token:
-        delete_session(token)
+        # DB에서 먼저 지운 뒤 캐시를 비움 (그 사이 시작된 조회는 generation으로 걸러짐)
+        await db.run(delete_session, token)
+        session_cache.discard(token)
     resp = JSONResponse({"ok": True})
     resp.delete_cookie("session_token")
     return resp
@@ -365,40 +677,55 @@ async def auth_check(request: Request):
     return {"ok": token is not None}
 
 @app.post("/api/change-password")
-async def change_password_api(request: Request, _=Depends(auth_guard)):
+async def change_password_api(request: Request, token=Depends(auth_guard)):
     body = await request.json()
     current = body.get("current_password", "")
     new_pw = body.get("new_password", "")
-    if not verify_password(current):
+    if not await db.run(verify_password, current):
         return JSONResponse({"ok": False, "error": "현재 비밀번호가 틀렸습니다"}, 400)
     if len(new_pw) < 4:
         return JSONResponse({"ok": False, "error": "비밀번호는 최소 4자 이상이어야 합니다"}, 400)
-    change_password(new_pw)
+    await db.run(change_password, new_pw)
+    # 다른 기기의 로그인은 모두 끊음 (현재 세션만 유지)
+    await db.run(delete_other_sessions, token)
+    session_cache.clear()
     return {"ok": True}
 
 
 # ─── SSE 스트림 ───
 
 @app.get("/api/events")
-async def sse_events(request: Request, _=Depends(auth_guard)):
+async def sse_events(request: Request, last_event_id: str = Query(""), _=Depends(auth_guard)):
+    # 재연결: 브라우저 자동 재연결은 Last-Event-ID 헤더, 직접 다시 연결할 때는 쿼리로 전달
+    resume_from = request.headers.get("Last-Event-ID") or last_event_id
+    missed = state.missed_since(resume_from) if resume_from else None
+    if missed is None:
+        # 처음 연결이거나 버퍼보다 오래 끊겼으면 전체 상태 전송
+        event_id = state.last_event_id()
+        initial = [
+            sse_frame({'event': 'status', 'data': {'connected': state.connected, 'streamer_id': state.streamer_id, 'stats': state.get_stats()}}, event_id),
+            sse_frame({'event': 'templates', 'data': state.templates}, event_id),
+            sse_frame({'event': 'results', 'data': state.results}, event_id),
+        ]
+    else:
+        initial = missed
+    # 초기 프레임 계산과 구독 등록 사이에 await가 없어 이벤트가 빠지거나 중복되지 않음
     queue = asyncio.Queue(maxsize=100)
     state.sse_queues.append(queue)
 
     async def event_generator():
         try:
-            # 초기 상태 전송
-            yield f"data: {json.dumps({'event': 'status', 'data': {'connected': state.connected, 'streamer_id': state.streamer_id, 'stats': state.get_stats()}})}\n\n"
-            yield f"data: {json.dumps({'event': 'templates', 'data': state.templates})}\n\n"
-            yield f"data: {json.dumps({'event': 'results', 'data': state.results})}\n\n"
+            yield SSE_RETRY
+            for frame in initial:
+                yield frame
 
             while True:
                 if await request.is_disconnected():
                     break
                 try:
-                    data = await asyncio.wait_for(queue.get(), timeout=30)
-                    yield f"data: {json.dumps(data, default=str)}\n\n"
+                    yield await asyncio.wait_for(queue.get(), timeout=30)
                 except asyncio.TimeoutError:
-                    yield f": keepalive\n\n"
+                    yield SSE_KEEPALIVE
         finally:
             if queue in state.sse_queues:
                 state.sse_queues.remove(queue)
@@ -415,8 +742,7 @@ async def sse_events(request: Request, _=Depends(auth_guard)):
 @app.get("/api/search-streamer")
 async def search_streamer(request: Request, streamer_id: str = Query(...), _=Depends(auth_guard)):
     try:
-        api = ApiService()
-        data = api.get_socket_data(streamer_id)
+        await state.api.get_socket_data(streamer_id)
         return {"ok": True, "streamer_id": streamer_id, "live": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "streamer_id": streamer_id}
@@ -442,7 +768,8 @@ async def connect_streamer(request: Request, _=Depends(auth_guard)):
     state.streamer_id = streamer_id
 
     # 새 클라이언트 생성
-    client = SoopChat(streamer_id)
+    client = SoopChat(streamer_id, api=state.api)
+    client.enable_metrics()
 
     def on_connect(connected):
         state.connected = connected
@@ -464,6 +791,8 @@ async def connect_streamer(request: Request, _=Depends(auth_guard)):
 
     # 최근 도네이션 유저 추적 (채팅 메시지 연결용 - 별풍/애드/미션 모두)
     recent_donation_users = {}  # {user_id: {"result_id": ..., "time": ...}}
+    # 이 유저들의 채팅만 파싱 (나머지 채팅은 수신 루프에서 파싱 전에 버림)
+    client.add_filter(FrameFilter(SVC_CHATMESG, user_ids=recent_donation_users))
 
     def on_balloon(b: Balloon):
         result_id = _handle_donation("balloon", b.user.id, b.user.name, b.count, "", "")
@@ -499,7 +828,7 @@ async def connect_streamer(request: Request, _=Depends(auth_guard)):
                 for r in state.results:
                     if r["id"] == rid and not r.get("message"):
                         r["message"] = msg.message
-                        db_update_result(rid, {"message": msg.message})
+                        result_writer.update(rid, {"message": msg.message})
                         state.broadcast({"event": "result_update", "data": r})
                         state.add_log(f"💬 {msg.user.name}: {msg.message}", "info")
                         break
@@ -509,13 +838,12 @@ async def connect_streamer(request: Request, _=Depends(auth_guard)):
         state.add_log(f"오류: {err}", "error")
         print(f"[ERROR] {err}")
 
-    def on_raw(raw_repr):
-        # keepalive(svc=0000) 관련 메시지만 출력
-        if "0000" in raw_repr[:20]:
-            print(f"[KEEPALIVE] pong received")
-        # 별풍선(svc=0018) raw 메시지 디버그
-        elif "0018" in raw_repr[:20]:
-            print(f"[BALLOON RAW] {raw_repr[:500]}")
+    # raw 훅은 등록한 서비스 코드의 프레임에만 호출됨
+    def on_keepalive_raw(header, payload):
+        print(f"[KEEPALIVE] pong received")
+
+    def on_balloon_raw(header, payload):
+        print(f"[BALLOON RAW] {bytes(payload[:500])!r}")
 
     client.on_connect(on_connect)
     client.on_join_channel(on_join)
@@ -525,61 +853,35 @@ async def connect_streamer(request: Request, _=Depends(auth_guard)):
     client.on_mission(on_mission)
     client.on_chat_message(on_chat)
     client.on_error(on_error)
-    client.on_raw_message(on_raw)
+    client.on_raw(SVC_KEEPALIVE, on_keepalive_raw)
+    client.on_raw(SVC_SENDBALLOON, on_balloon_raw)
 
-    state.client = client
-    state._should_reconnect = True
+    def on_reconnecting(info: ReconnectInfo):
+        state.add_log(f"연결 끊김 → {info.delay:.1f}초 후 재연결 ({info.attempts}/{RECONNECT_POLICY.max_attempts})", "warn")
 
-    # 백그라운드에서 연결 (자동 재연결 포함)
-    async def run_client():
-        retry_count = 0
-        max_retries = 50  # 최대 50회 재연결 시도
-        while state._should_reconnect and retry_count < max_retries:
-            try:
-                # 매번 새 클라이언트 생성 (재연결 시)
-                if retry_count > 0:
-                    new_client = SoopChat(streamer_id)
-                    new_client.on_connect(on_connect)
-                    new_client.on_join_channel(on_join)
-                    new_client.on_balloon(on_balloon)
-                    new_client.on_adballoon(on_adballoon)
-                    new_client.on_subscription(on_subscription)
-                    new_client.on_mission(on_mission)
-                    new_client.on_chat_message(on_chat)
-                    new_client.on_error(on_error)
-                    new_client.on_raw_message(on_raw)
-                    state.client = new_client
-                    state.add_log(f"재연결 시도 #{retry_count}...", "warn")
-
-                await state.client.connect()
+    def on_reconnect(info: ReconnectInfo):
+        state.add_log(f"재연결 성공 ({info.downtime:.1f}초 만에 복구, {info.attempts}회 시도)", "success")
 
-            except Exception as e:
-                err_msg = str(e)
-                print(f"[DISCONNECT] {err_msg}")
-
-                # 방송 종료인 경우 재연결 중단
-                if "방송 중이 아닙니다" in err_msg:
-                    state.add_log(f"방송이 종료되었습니다", "warn")
-                    state._should_reconnect = False
-                    break
+    client.on("reconnecting", on_reconnecting)
+    client.on("reconnect", on_reconnect)
 
-                state.connected = False
-                state.broadcast({"event": "status", "data": {
-                    "connected": False,
-                    "streamer_id": state.streamer_id,
-                    "stats": state.get_stats(),
-                }})
-
-                if not state._should_reconnect:
-                    break
-
-                retry_count += 1
-                wait_sec = min(5 * retry_count, 30)  # 5초, 10초... 최대 30초
-                state.add_log(f"연결 끊김 → {wait_sec}초 후 재연결 ({retry_count}/{max_retries})", "warn")
-                await asyncio.sleep(wait_sec)
+    state.client = client
+    state._should_reconnect = True
 
-        if retry_count >= max_retries:
-            state.add_log("최대 재연결 횟수 초과. 수동으로 재연결하세요.", "error")
+    # 백그라운드에서 연결 (재연결은 라이브러리가 처리, 콜백/채팅 서버 정보 유지)
+    async def run_client():
+        try:
+            await client.run(RECONNECT_POLICY)
+        except Exception as e:
+            err_msg = str(e)
+            print(f"[DISCONNECT] {err_msg}")
+            if "방송 중이 아닙니다" in err_msg:
+                state.add_log(f"방송이 종료되었습니다", "warn")
+            else:
+                state.add_log(f"재연결 중단: {err_msg} (수동으로 재연결하세요)", "error")
+        if state.client is not client:
+            return  # 이미 다른 스트리머로 교체됨
+        state._should_reconnect = False
         state.connected = False
         state.broadcast({"event": "status", "data": {
             "connected": False,
@@ -642,14 +944,23 @@ def _handle_donation(dtype: str, user_id: str, user_name: str, count: int, title
     if not matched:
         return None
 
-    result_id = db_save_result(result)
-    result["id"] = result_id
+    result_id = result["id"] = result_writer.next_id()
+    result_writer.insert(result)
     state.results.insert(0, result)
     state.broadcast({"event": "result", "data": result})
     state.broadcast({"event": "stats", "data": state.get_stats()})
     return result_id
 
 
+@app.get("/api/metrics")
+async def get_metrics(request: Request, _=Depends(auth_guard)):
+    """수신 계측 (서비스 코드별 프레임/바이트, 파서/콜백 지연, keepalive RTT)"""
+    client = state.client
+    if client is None or client.metrics is None:
+        return {"ok": False, "error": "연결된 스트리머가 없습니다"}
+    return {"ok": True, "streamer_id": state.streamer_id, "metrics": client.metrics.snapshot(), "filtered": client.filtered, "sessions": session_cache.stats()}
+
+
 @app.post("/api/disconnect")
 async def disconnect_streamer(request: Request, _=Depends(auth_guard)):
     state._should_reconnect = False  # 자동 재연결 중지
@@ -684,7 +995,7 @@ async def add_template(request: Request, _=Depends(auth_guard)):
         "started_at": time.time(),               # 등록 시각 (타이머 기준)
         "active": True,
     }
-    tmpl["id"] = db_save_template(tmpl)
+    tmpl["id"] = await db.run(db_save_template, tmpl)
     state.templates.append(tmpl)
     state.broadcast({"event": "templates", "data": state.templates})
     state.add_log(f"미션 등록: {tmpl['name']} ({tmpl['count']}개)", "success")
@@ -698,7 +1009,7 @@ async def update_template(request: Request, _=Depends(auth_guard)):
     for tmpl in state.templates:
         if tmpl["id"] == tmpl_id:
             tmpl.update({k: v for k, v in body.items() if k != "id"})
-            db_update_template(tmpl_id, {k: v for k, v in body.items() if k != "id"})
+            await db.run(db_update_template, tmpl_id, {k: v for k, v in body.items() if k != "id"})
             break
     state.broadcast({"event": "templates", "data": state.templates})
     return {"ok": True}
@@ -709,7 +1020,7 @@ async def delete_template(request: Request, _=Depends(auth_guard)):
     body = await request.json()
     tmpl_id = body.get("id")
     state.templates = [t for t in state.templates if t["id"] != tmpl_id]
-    db_delete_template(tmpl_id)
+    await db.run(db_delete_template, tmpl_id)
     state.broadcast({"event": "templates", "data": state.templates})
     return {"ok": True}
 
@@ -728,7 +1039,7 @@ async def toggle_result(request: Request, _=Depends(auth_guard)):
     for r in state.results:
         if r["id"] == rid:
             r["done"] = not r["done"]
-            db_update_result(rid, {"done": r["done"]})
+            result_writer.update(rid, {"done": r["done"]})
             state.broadcast({"event": "result_update", "data": r})
             break
     state.broadcast({"event": "stats", "data": state.get_stats()})
@@ -740,10 +1051,12 @@ async def update_memo(request: Request, _=Depends(auth_guard)):
     body = await request.json()
     rid = body.get("id")
     memo = body.get("memo", "")
+    if not isinstance(memo, str):
+        return JSONResponse({"ok": False, "error": "메모는 문자열이어야 합니다"}, 400)
     for r in state.results:
         if r["id"] == rid:
             r["memo"] = memo
-            db_update_result(rid, {"memo": memo})
+            result_writer.update(rid, {"memo": memo})
             state.broadcast({"event": "result_update", "data": r})
             break
     return {"ok": True}
@@ -754,7 +1067,7 @@ async def delete_result(request: Request, _=Depends(auth_guard)):
     body = await request.json()
     rid = body.get("id")
     state.results = [r for r in state.results if r["id"] != rid]
-    db_delete_result(rid)
+    result_writer.delete(rid)
     state.broadcast({"event": "results", "data": state.results})
     state.broadcast({"event": "stats", "data": state.get_stats()})
     return {"ok": True}
@@ -763,7 +1076,7 @@ async def delete_result(request: Request, _=Depends(auth_guard)):
 @app.post("/api/results/clear")
 async def clear_results(request: Request, _=Depends(auth_guard)):
     state.results = []
-    db_clear_results()
+    result_writer.clear()
     state.broadcast({"event": "results", "data": state.results})
     state.broadcast({"event": "stats", "data": state.get_stats()})
     state.add_log("결과 초기화됨", "warn")
@@ -821,7 +1134,8 @@ async def simulate(request: Request, _=Depends(auth_guard)):
             "time": datetime.now(timezone(timedelta(hours=9))).strftime("%p %I:%M:%S"),
             "timestamp": time.time(),
         }
-        result["id"] = db_save_result(result)
+        result["id"] = result_writer.next_id()
+        result_writer.insert(result)
 
         state.results.insert(0, result)
         state.broadcast({"event": "result", "data": result})
@@ -26,6 +26,13 @@ Python 포팅 버전
 """
 
 from .client import SoopChat
+from .pool import SoopChatPool
+from .reconnect import ReconnectPolicy, ReconnectInfo
+from .recorder import CaptureWriter, CaptureReader, CapturedFrame
+from .filters import FrameFilter
+from .roster import Roster, RosterSnapshot
+from .metrics import ClientMetrics, Histogram
+from .stream import Event, EventStream, PriorityEventStream, LanePolicy
 from .types import (
     User,
     UserFlag,
@@ -43,6 +50,21 @@ from .constants import *
 __version__ = "1.0.0"
 __all__ = [
     "SoopChat",
+    "SoopChatPool",
+    "ReconnectPolicy",
+    "ReconnectInfo",
+    "CaptureWriter",
+    "CaptureReader",
+    "CapturedFrame",
+    "FrameFilter",
+    "Roster",
+    "RosterSnapshot",
+    "ClientMetrics",
+    "Histogram",
+    "Event",
+    "EventStream",
+    "PriorityEventStream",
+    "LanePolicy",
     "User",
     "UserFlag",
     "Flag1",
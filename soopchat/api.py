@@ -1,37 +1,87 @@
-import requests
+import asyncio
+from typing import Iterable, Optional
+
+import aiohttp
 
 DATA_URL = "https://live.sooplive.co.kr/afreeca/player_live_api.php?bjId={}"
 LOGIN_URL = "https://login.sooplive.co.kr/app/LoginAction.php"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0"
 
+# connect: TCP+TLS 연결, sock_read: 응답 읽기 간격, total: 요청 전체 상한
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5, sock_read=5)
+
 
 class ApiService:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers["User-Agent"] = USER_AGENT
-        self.session.timeout = 5
+    """SOOP HTTP API (비동기)
+
+    하나의 aiohttp 세션(커넥션 풀)을 여러 요청과 여러 SoopChat이 공유할 수 있습니다.
+    세션은 첫 요청 때 현재 이벤트 루프에서 만들어집니다.
+
+        async with ApiService() as api:
+            data = await api.get_socket_data("streamer_id")
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        limit: int = 100,
+        data_url: str = DATA_URL,
+        chat_scheme: str = "wss",
+    ):
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.limit = limit
+        # 로컬 테스트 서버(soopchat.fakeserver)로 돌릴 때 바꾸는 값
+        self.data_url = data_url          # 스트리머 ID 자리에 {}
+        self.chat_scheme = chat_scheme    # "wss" 또는 "ws"
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, ttl_dns_cache=300),
+                timeout=self.timeout,
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
 
-    def get_socket_data(self, streamer_id: str) -> dict:
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _post_json(self, url: str, data: dict) -> dict:
+        async with self.session.post(url, data=data) as resp:
+            resp.raise_for_status()
+            # SOOP은 JSON을 text/html로 내려주는 경우가 있어 content-type 검사를 끈다
+            return await resp.json(content_type=None)
+
+    async def get_socket_data(self, streamer_id: str) -> dict:
         """채팅 서버 주소, 포트, 방 번호를 가져온다.
 
         Returns:
             dict: {
-                "socket_address": "wss://...",
+                "socket_address": "wss://..." (chat_scheme),
                 "chat_room": "...",
             }
 
         Raises:
             Exception: 방송 정보를 가져올 수 없는 경우
+            asyncio.TimeoutError: 연결/응답 시간 초과
         """
-        resp = self.session.post(
-            DATA_URL.format(streamer_id),
-            data={
+        data = await self._post_json(
+            self.data_url.format(streamer_id),
+            {
                 "bid": streamer_id,
                 "player_type": "html5",
             },
         )
-        resp.raise_for_status()
-        data = resp.json()
 
         channel = data.get("CHANNEL", {})
         result = channel.get("RESULT")
@@ -48,28 +98,49 @@ class ApiService:
         if not domain:
             raise Exception("채팅 서버 정보를 가져올 수 없습니다")
 
-        socket_address = f"wss://{domain}:{port}/Websocket"
+        socket_address = f"{self.chat_scheme}://{domain}:{port}/Websocket"
 
         return {
             "socket_address": socket_address,
             "chat_room": chat_room,
         }
 
-    def login(self, user_id: str, password: str) -> bool:
+    async def get_socket_data_many(
+        self,
+        streamer_ids: Iterable[str],
+        concurrency: int = 10,
+    ) -> dict[str, dict | Exception]:
+        """여러 스트리머의 채팅 서버 정보를 동시에 조회
+
+        Returns:
+            dict: {streamer_id: get_socket_data 결과 또는 발생한 예외}
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(streamer_id: str):
+            async with semaphore:
+                try:
+                    return await self.get_socket_data(streamer_id)
+                except Exception as e:
+                    return e
+
+        ids = list(dict.fromkeys(streamer_ids))
+        results = await asyncio.gather(*(fetch(sid) for sid in ids))
+        return dict(zip(ids, results))
+
+    async def login(self, user_id: str, password: str) -> bool:
         """SOOP 계정으로 로그인
 
         Returns:
             bool: 로그인 성공 여부
         """
-        resp = self.session.post(
+        data = await self._post_json(
             LOGIN_URL,
-            data={
+            {
                 "szWork": "login",
                 "szType": "json",
                 "szUid": user_id,
                 "szPassword": password,
             },
         )
-        resp.raise_for_status()
-        data = resp.json()
         return data.get("RESULT") == 1
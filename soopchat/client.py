@@ -1,7 +1,11 @@
 import asyncio
+import inspect
 import ssl
+import time
 import logging
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Iterable, Optional
+from urllib.parse import urlsplit
+from urllib.request import getproxies
 
 import websockets
 
@@ -11,11 +15,16 @@ from .types import (
     User, ChatMessage, UserList, Balloon, Adballoon,
     Subscription, Mission,
 )
-from .utils import (
-    make_header, make_buffer, get_service_code,
-    default_log, default_info,
-    build_log_handshake, build_info_handshake,
-)
+from .packets import encode_login, encode_join, encode_chat, KEEPALIVE_PACKET
+from .frame import Frame, FrameDecoder, FrameHeader
+from .recorder import CaptureWriter
+from .filters import FrameFilter
+from .roster import Roster
+from .metrics import ClientMetrics
+from .sender import SendQueue, PRIORITY_NORMAL
+from .connector import ResumingSSLContext, DnsCache, DEFAULT_DNS_CACHE
+from .reconnect import ReconnectPolicy, ReconnectInfo
+from .stream import Event, EventStream, PriorityEventStream, LanePolicy, OVERFLOW_BLOCK
 from .messages import (
     parse_join_channel, parse_user_join, parse_chat_message,
     parse_balloon, parse_adballoon, parse_subscription,
@@ -24,6 +33,38 @@ from .messages import (
 
 logger = logging.getLogger("soopchat")
 
+PING_INTERVAL = 20  # keepalive 주기 (초)
+
+
+def make_ssl_context() -> ResumingSSLContext:
+    """채팅 서버용 TLS 컨텍스트 (인증서 검증 없음, 여러 연결이 공유, 재연결 시 세션 재개)"""
+    ssl_ctx = ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_ctx.check_hostname = False
+    ssl_ctx.verify_mode = ssl.CERT_NONE
+    return ssl_ctx
+
+
+# 서비스 코드 → (이벤트 이름, 파서)
+EVENT_TABLE: dict[int, tuple[str, Callable]] = {
+    SVC_JOINCH: ("join_channel", parse_join_channel),
+    SVC_CHUSER: ("user_lists", parse_user_join),
+    SVC_CHATMESG: ("chat_message", parse_chat_message),
+    SVC_SENDBALLOON: ("balloon", parse_balloon),
+    SVC_ADCON_EFFECT: ("adballoon", parse_adballoon),
+    SVC_FOLLOW_ITEM: ("subscription", lambda m: parse_subscription(m, SVC_FOLLOW_ITEM)),
+    SVC_FOLLOW_ITEM_EFFECT: ("subscription", lambda m: parse_subscription(m, SVC_FOLLOW_ITEM_EFFECT)),
+    SVC_SENDADMINNOTICE: ("admin_notice", parse_admin_notice),
+    SVC_MISSION: ("mission", parse_mission),
+}
+
+# 파싱되는 이벤트 이름 (events() 기본 구독 대상)
+DATA_EVENTS = tuple(dict.fromkeys(event for event, _ in EVENT_TABLE.values()))
+
+# 등록 가능한 이벤트 이름
+EVENTS = frozenset({
+    "error", "connect", "login", "raw_message", "reconnecting", "reconnect", "metrics", *DATA_EVENTS,
+})
+
 
 class SoopChat:
     """SOOP 채팅 클라이언트 (비공식)
@@ -36,6 +77,10 @@ class SoopChat:
         client.on_balloon(lambda b: print(f"{b.user.name}: {b.count}개"))
         await client.connect()
 
+    같은 이벤트에 리스너를 여러 개 등록할 수 있습니다:
+        client.on("balloon", save_to_db)
+        client.on("balloon", send_to_analytics)
+
     로그인 (채팅 보내기):
         client = SoopChat("streamer_id", user_id="id", password="pw")
         await client.connect()
@@ -48,6 +93,10 @@ class SoopChat:
         user_id: str = "",
         password: str = "",
         channel_password: str = "",
+        api: Optional[ApiService] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        ping_offset: float = 0.0,
+        dns_cache: Optional[DnsCache] = None,
     ):
         if not streamer_id:
             raise ValueError("streamer_id는 필수입니다")
@@ -64,127 +113,460 @@ class SoopChat:
         self._fan_ticket = ""
         self._flag = ""
         self._ws = None
+        self._decoder: Optional[FrameDecoder] = None
         self._running = False
-        self._api = ApiService()
-
-        # 콜백
-        self._on_error: Optional[Callable] = None
-        self._on_connect: Optional[Callable] = None
-        self._on_join_channel: Optional[Callable] = None
-        self._on_raw_message: Optional[Callable] = None
-        self._on_chat_message: Optional[Callable] = None
-        self._on_user_lists: Optional[Callable] = None
-        self._on_balloon: Optional[Callable] = None
-        self._on_adballoon: Optional[Callable] = None
-        self._on_subscription: Optional[Callable] = None
-        self._on_admin_notice: Optional[Callable] = None
-        self._on_mission: Optional[Callable] = None
-        self._on_login: Optional[Callable] = None
+        self._stopping = False
+        self._logged_in = False
+        self._join_packet: Optional[tuple[tuple, bytes]] = None
+        self._recorder: Optional[CaptureWriter] = None
+
+        # 재연결 상태
+        self._connected_at: Optional[float] = None     # 로그인 응답을 받은 시각
+        self._disconnected_at: Optional[float] = None  # 연결이 끊긴 시각 (복구되면 None)
+        self._attempts = 0                             # 복구까지의 재시도 횟수
+        self.reconnects = 0
+        # api를 넘기면 HTTP 커넥션 풀을 공유 (닫기는 넘겨준 쪽 책임)
+        self._api = api or ApiService()
+        self._own_api = api is None
+        self._ssl_context = ssl_context or make_ssl_context()
+        self._dns = dns_cache or DEFAULT_DNS_CACHE
+        # 첫 keepalive를 앞당기는 시간 (여러 연결의 ping이 한꺼번에 몰리지 않게 분산)
+        self._ping_offset = ping_offset % PING_INTERVAL
+
+        # 이벤트 리스너 (이벤트 이름 → 콜백 튜플, 등록/해제 시 새 튜플로 교체)
+        self._listeners: dict[str, tuple[Callable, ...]] = {}
+        # raw 훅 (서비스 코드 → 콜백 튜플, 등록된 코드의 프레임만 헤더/뷰를 만듦)
+        self._raw_hooks: dict[int, tuple[Callable, ...]] = {}
+        # 파싱 전 필터 (서비스 코드 → 컴파일된 판정 함수 튜플)
+        self._filters: dict[int, tuple[Callable[[bytes], bool], ...]] = {}
+        self.filtered: dict[int, int] = {}   # 서비스 코드별 필터로 버린 프레임 수
+        self.roster: Optional[Roster] = None
+        self.metrics: Optional[ClientMetrics] = None
+        self._metrics_interval = 0.0
+        self._ping_sent_at = 0          # 마지막 keepalive 전송 시각 (perf_counter_ns, 응답 받으면 0)
+        self._sender: Optional[SendQueue] = None
+        self._streams: set[EventStream | PriorityEventStream] = set()
 
     # ─── 콜백 등록 ───
 
-    def on_error(self, callback: Callable):
-        self._on_error = callback
+    def on(self, event: str, callback: Callable):
+        """이벤트 리스너 추가 (같은 이벤트에 여러 개 등록 가능)
+
+        콜백이 코루틴 함수면 수신 루프에서 순서대로 await 됩니다.
+        """
+        if event not in EVENTS:
+            raise ValueError(f"알 수 없는 이벤트: {event}")
+        self._listeners[event] = self._listeners.get(event, ()) + (callback,)
         return self
 
-    def on_connect(self, callback: Callable):
-        self._on_connect = callback
+    def off(self, event: str, callback: Optional[Callable] = None):
+        """이벤트 리스너 제거 (callback 생략 시 해당 이벤트 전체 제거)"""
+        if callback is None:
+            self._listeners.pop(event, None)
+            return self
+        remaining = tuple(cb for cb in self._listeners.get(event, ()) if cb != callback)
+        if remaining:
+            self._listeners[event] = remaining
+        else:
+            self._listeners.pop(event, None)
         return self
 
+    def on_error(self, callback: Callable):
+        return self.on("error", callback)
+
+    def on_connect(self, callback: Callable):
+        return self.on("connect", callback)
+
     def on_join_channel(self, callback: Callable):
-        self._on_join_channel = callback
-        return self
+        return self.on("join_channel", callback)
 
     def on_raw_message(self, callback: Callable):
-        self._on_raw_message = callback
-        return self
+        """모든 패킷의 repr 문자열 (디버그용, 프레임마다 문자열을 만듦 → 운영에서는 on_raw 사용)"""
+        return self.on("raw_message", callback)
 
     def on_chat_message(self, callback: Callable):
-        self._on_chat_message = callback
-        return self
+        return self.on("chat_message", callback)
 
     def on_user_lists(self, callback: Callable):
-        self._on_user_lists = callback
-        return self
+        return self.on("user_lists", callback)
 
     def on_balloon(self, callback: Callable):
-        self._on_balloon = callback
-        return self
+        return self.on("balloon", callback)
 
     def on_adballoon(self, callback: Callable):
-        self._on_adballoon = callback
-        return self
+        return self.on("adballoon", callback)
 
     def on_subscription(self, callback: Callable):
-        self._on_subscription = callback
-        return self
+        return self.on("subscription", callback)
 
     def on_admin_notice(self, callback: Callable):
-        self._on_admin_notice = callback
-        return self
+        return self.on("admin_notice", callback)
 
     def on_mission(self, callback: Callable):
-        self._on_mission = callback
-        return self
+        return self.on("mission", callback)
 
     def on_login(self, callback: Callable):
-        self._on_login = callback
+        return self.on("login", callback)
+
+    def on_raw(self, svc: int, callback: Callable[[FrameHeader, memoryview], None]):
+        """서비스 코드별 raw 훅 추가: callback(header, payload)
+
+        header는 FrameHeader, payload는 헤더를 뺀 본문의 읽기 전용 memoryview입니다.
+        파싱 전에 호출되며, 등록되지 않은 서비스 코드의 프레임에는 아무것도 만들지 않습니다.
+        payload는 수신 버퍼의 뷰이므로 콜백 밖에서 쓰려면 bytes(payload)로 복사하세요.
+        """
+        self._raw_hooks[svc] = self._raw_hooks.get(svc, ()) + (callback,)
         return self
 
+    def off_raw(self, svc: int, callback: Optional[Callable] = None):
+        """raw 훅 제거 (callback 생략 시 해당 서비스 코드 전체 제거)"""
+        remaining = () if callback is None else tuple(
+            cb for cb in self._raw_hooks.get(svc, ()) if cb != callback
+        )
+        if remaining:
+            self._raw_hooks[svc] = remaining
+        else:
+            self._raw_hooks.pop(svc, None)
+        return self
+
+    # ─── 시청자 명단 ───
+
+    def track_roster(self, maxsize: int = 500_000, tracked: Optional[dict[str, int]] = None) -> Roster:
+        """입장/퇴장 이벤트로 시청자 명단을 유지 (roster 속성으로도 접근)
+
+        (재)연결될 때마다 비우고, 입장 직후 서버가 보내는 전체 목록부터 다시 채웁니다.
+        """
+        if self.roster is None:
+            self.roster = Roster(maxsize, tracked)
+            self.on("user_lists", self.roster.apply)
+            self.on("connect", self._reset_roster)
+        return self.roster
+
+    def _reset_roster(self, connected: bool):
+        if connected and self.roster is not None:
+            self.roster.clear()
+
+    # ─── 계측 ───
+
+    def enable_metrics(self, interval: float = 0.0) -> ClientMetrics:
+        """서비스 코드별 카운터, 파서/콜백 지연, keepalive RTT 계측 시작
+
+        interval > 0이면 연결되어 있는 동안 그 주기로 "metrics" 이벤트에 스냅샷(dict)을 전달합니다.
+        """
+        if self.metrics is None:
+            self.metrics = ClientMetrics()
+        self._metrics_interval = interval
+        return self.metrics
+
+    async def _metrics_loop(self):
+        try:
+            while self._running:
+                await asyncio.sleep(self._metrics_interval)
+                if self.metrics is not None and self._running:
+                    self._emit("metrics", self.metrics.snapshot())
+        except asyncio.CancelledError:
+            pass
+
+    # ─── 파싱 전 필터 ───
+
+    def add_filter(self, frame_filter: FrameFilter) -> Callable[[], None]:
+        """파싱 전 필터 추가 (filters.FrameFilter 참고)
+
+        Returns:
+            필터를 제거하는 함수
+        """
+        svc = frame_filter.svc
+        accept = frame_filter.compile()
+        self._filters[svc] = self._filters.get(svc, ()) + (accept,)
+
+        def remove():
+            remaining = tuple(f for f in self._filters.get(svc, ()) if f is not accept)
+            if remaining:
+                self._filters[svc] = remaining
+            else:
+                self._filters.pop(svc, None)
+
+        return remove
+
+    # ─── 이벤트 스트림 ───
+
+    def events(
+        self,
+        maxsize: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        names: Optional[Iterable[str]] = None,
+    ) -> EventStream:
+        """수신 루프와 분리된 이벤트 스트림을 엽니다.
+
+        수신 루프는 이벤트를 큐에 넣기만 하고, 처리는 소비자가 따로 합니다.
+        overflow: "block"(큐에 자리가 날 때까지 수신 대기), "drop_oldest", "drop_newest"
+        names: 받을 이벤트 이름 (생략 시 파싱되는 모든 이벤트)
+
+            asyncio.create_task(client.connect())
+            async for event in client.events(maxsize=500, overflow="drop_oldest"):
+                print(event.name, event.data)
+        """
+        return self._open_stream(EventStream(maxsize=maxsize, overflow=overflow), names)
+
+    def priority_events(
+        self,
+        policies: Optional[dict[str, LanePolicy]] = None,
+        names: Optional[Iterable[str]] = None,
+    ) -> PriorityEventStream:
+        """우선순위 레인 스트림을 엽니다 (stream.PriorityEventStream 참고)
+
+        별풍선/애드벌룬/미션/구독은 항상 먼저 나오고 버려지지 않으며,
+        공지/채팅/입퇴장은 레인별 LanePolicy에 따라 밀리면 버려집니다.
+
+            stream = client.priority_events({"chat": LanePolicy(maxsize=500, max_age=3)})
+            async for event in stream:
+                ...
+            stream.metrics()   # 레인별 depth, shed, delivered
+        """
+        return self._open_stream(PriorityEventStream(policies), names)
+
+    def _open_stream(self, stream, names: Optional[Iterable[str]]):
+        names = tuple(names) if names else DATA_EVENTS
+        for name in names:
+            if name not in EVENTS:
+                raise ValueError(f"알 수 없는 이벤트: {name}")
+
+        detach = self.attach_stream(stream, names)
+
+        def on_close():
+            detach()
+            self._streams.discard(stream)
+
+        stream._on_close = on_close
+        self._streams.add(stream)
+        return stream
+
+    def attach_stream(self, stream: EventStream, names: Iterable[str] = DATA_EVENTS) -> Callable[[], None]:
+        """기존 스트림에 이 클라이언트의 이벤트를 흘려보냄 (여러 클라이언트가 한 스트림 공유 가능)
+
+        Returns:
+            리스너를 해제하는 함수. 스트림 자체는 닫지 않습니다.
+        """
+        feeders = []
+        for name in names:
+            async def feed(data=None, name=name):
+                await stream.put(Event(name, data, time.time(), self.streamer_id))
+            self.on(name, feed)
+            feeders.append((name, feed))
+
+        def detach():
+            for name, feed in feeders:
+                self.off(name, feed)
+
+        return detach
+
+    # ─── 녹화 ───
+
+    def record(self, path: str) -> CaptureWriter:
+        """수신한 모든 패킷을 캡처 파일에 기록 (수신 시각, 서비스 코드와 함께)
+
+        재연결 사이에도 같은 파일에 이어서 기록합니다. 읽기는 recorder.CaptureReader.
+        """
+        self.stop_recording()
+        self._recorder = CaptureWriter(path)
+        return self._recorder
+
+    def stop_recording(self):
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _close_streams(self):
+        for stream in list(self._streams):
+            stream.close()
+
+    def _emit(self, event: str, *args):
+        """리스너 호출 (동기 컨텍스트용, 코루틴 리스너는 태스크로 예약)"""
+        for callback in self._listeners.get(event, ()):
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result)
+            except Exception as e:
+                self._listener_failed(event, e)
+
+    async def _emit_async(self, event: str, *args):
+        """리스너 호출 (수신 루프용, 코루틴 리스너는 순서대로 await)"""
+        for callback in self._listeners.get(event, ()):
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._listener_failed(event, e)
+
+    def _listener_failed(self, event: str, error: Exception):
+        """리스너 하나의 예외가 다른 리스너/수신 루프를 멈추지 않도록 격리"""
+        if event == "error":
+            logger.exception("error listener failed")
+            return
+        logger.debug(f"{event} listener error: {error}")
+        self._emit("error", error)
+
     # ─── 메인 연결 ───
 
     async def connect(self):
         """채팅 서버에 연결하고 이벤트 수신을 시작합니다.
 
         이 메서드는 연결이 끊어질 때까지 블로킹됩니다.
+        연결이 끝나면 events()로 연 스트림도 함께 닫힙니다.
+        """
+        self._stopping = False
+        try:
+            await self._connect_once(refresh=True)
+        finally:
+            await self._finish()
+
+    async def run(
+        self,
+        policy: Optional[ReconnectPolicy] = None,
+        pace: Optional[Callable[[], Awaitable]] = None,
+    ):
+        """연결이 끊겨도 자동으로 재연결하며 수신합니다.
+
+        disconnect()가 호출되거나 재시도할 수 없는 오류(방송 종료 등),
+        policy.max_attempts 초과 시에만 끝납니다 (마지막 오류를 다시 던짐).
+        리스너와 이벤트 스트림, 채팅 서버 정보는 재연결 사이에 유지되고,
+        재연결에 성공하면 "reconnect" 이벤트로 ReconnectInfo가 전달됩니다.
+
+        pace: 매 연결 시도 전에 await 할 함수 (SoopChatPool이 연결 간격 조절에 사용)
         """
+        policy = policy or ReconnectPolicy()
+        loop = asyncio.get_running_loop()
+        self._stopping = False
+        failures = 0
+        try:
+            while not self._stopping:
+                if pace:
+                    await pace()
+                self._connected_at = None
+                error = None
+                try:
+                    await self._connect_once(refresh=failures >= policy.refresh_after)
+                except Exception as e:
+                    error = e
+                if self._stopping:
+                    break
+                if error is not None and policy.is_fatal(error):
+                    raise error
+
+                connected_at = self._connected_at
+                if connected_at is not None and loop.time() - connected_at >= policy.stable_after:
+                    # 충분히 유지된 연결이 끊김 → 첫 재시도는 바로
+                    failures = 0
+                    delay = 0.0 if policy.immediate_retry else policy.delay(1)
+                else:
+                    # 연결 실패 또는 로그인 직후 끊김 → 백오프
+                    failures += 1
+                    if policy.max_attempts and failures >= policy.max_attempts:
+                        raise error or Exception("최대 재연결 횟수 초과")
+                    delay = policy.delay(failures)
+
+                self._attempts += 1
+                downtime = loop.time() - self._disconnected_at if self._disconnected_at else 0.0
+                self._emit("reconnecting", ReconnectInfo(
+                    attempts=self._attempts,
+                    downtime=downtime,
+                    total_reconnects=self.reconnects,
+                    delay=delay,
+                ))
+                logger.info(f"[{self.streamer_id}] {delay:.1f}초 후 재연결 (#{self._attempts})")
+                if delay:
+                    await asyncio.sleep(delay)
+        finally:
+            await self._finish()
+
+    async def _finish(self):
+        """connect()/run() 종료 정리: 스트림 닫기, 녹화 파일 닫기, 소유한 HTTP 세션 닫기"""
+        self._close_streams()
+        self.stop_recording()
+        await self._close_sender()
+        if self._own_api:
+            await self._api.close()
+
+    async def _connect_once(self, refresh: bool = True):
+        """로그인 → 채팅 서버 정보 조회 → WebSocket 수신 (연결 1회)
+
+        refresh=False면 이전에 받아둔 로그인 상태/채팅 서버 정보를 재사용합니다.
+        """
+        if refresh:
+            self._logged_in = False
+            self._socket_address = ""
+
         # 로그인 (선택)
-        if self.user_id and self.password:
+        if self.user_id and self.password and not self._logged_in:
             try:
-                success = self._api.login(self.user_id, self.password)
-                if self._on_login:
-                    self._on_login(success)
+                success = await self._api.login(self.user_id, self.password)
+                self._emit("login", success)
                 if not success:
                     raise Exception("로그인 실패")
+                self._logged_in = True
             except Exception as e:
-                if self._on_error:
-                    self._on_error(e)
+                self._emit("error", e)
                 raise
 
         # 채팅 서버 정보 가져오기
-        try:
-            data = self._api.get_socket_data(self.streamer_id)
-            self._socket_address = data["socket_address"]
-            self._chat_room = data["chat_room"]
-        except Exception as e:
-            if self._on_error:
-                self._on_error(e)
-            raise
+        if not self._socket_address:
+            try:
+                data = await self._api.get_socket_data(self.streamer_id)
+                self._socket_address = data["socket_address"]
+                self._chat_room = data["chat_room"]
+            except Exception as e:
+                self._emit("error", e)
+                raise
 
         # WebSocket 연결
         try:
             await self._connect_websocket()
         except Exception as e:
-            if self._on_error:
-                self._on_error(e)
+            self._emit("error", e)
             raise
 
     async def _connect_websocket(self):
         """WebSocket 연결 및 핸드셰이크, 메시지 루프"""
-        ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ssl_ctx.check_hostname = False
-        ssl_ctx.verify_mode = ssl.CERT_NONE
-
-        async with websockets.connect(
-            self._socket_address,
-            ssl=ssl_ctx,
-            subprotocols=["chat"],
-            open_timeout=10,
-            max_size=None,
-            ping_interval=None,   # SOOP 자체 keepalive 사용, 자동 ping 비활성화
-            ping_timeout=None,    # 자동 pong 타임아웃 비활성화
-            close_timeout=5,
-        ) as ws:
+        url = urlsplit(self._socket_address)
+        secure = url.scheme == "wss"
+        port = url.port or (443 if secure else 80)
+
+        # 캐시된 주소로 바로 연결 (프록시 사용 시 제외)
+        # host를 IP로 바꾸면 asyncio가 그 IP를 SNI/인증서 확인에 쓰므로 (websockets 13 이하)
+        # server_hostname에 원래 호스트 이름을 직접 넘김 (TLS 세션도 이 이름으로 찾음)
+        extra = {}
+        address = None
+        if not getproxies():
+            address = await self._dns.resolve(url.hostname, port)
+            if address:
+                extra = {"host": address, "port": port}
+                if secure:
+                    extra["server_hostname"] = url.hostname
+
+        started = time.perf_counter()
+        try:
+            ws = await websockets.connect(
+                self._socket_address,
+                ssl=self._ssl_context if secure else None,
+                subprotocols=["chat"],
+                open_timeout=10,
+                max_size=None,
+                ping_interval=None,   # SOOP 자체 keepalive 사용, 자동 ping 비활성화
+                ping_timeout=None,    # 자동 pong 타임아웃 비활성화
+                close_timeout=5,
+                **extra,
+            )
+        except (OSError, asyncio.TimeoutError):
+            if address:
+                self._dns.invalidate(url.hostname)
+            raise
+
+        ssl_object = ws.transport.get_extra_info("ssl_object")
+        self._record_handshake(ssl_object, time.perf_counter() - started)
+
+        async with ws:
             self._ws = ws
             self._running = True
 
@@ -193,190 +575,277 @@ class SoopChat:
             await ws.send(login_packet)
 
             # 2) Ping 태스크 시작
+            self._ping_sent_at = 0
             ping_task = asyncio.create_task(self._ping_loop())
+            metrics_task = None
+            if self.metrics is not None and self._metrics_interval > 0:
+                metrics_task = asyncio.create_task(self._metrics_loop())
+
+            # 헤더의 페이로드 길이로 패킷 분리 (한 메시지에 여러 패킷 / 메시지에 걸친 패킷)
+            decoder = self._decoder = FrameDecoder()
 
             try:
                 # 3) 메시지 수신 루프
                 async for raw in ws:
                     if isinstance(raw, str):
                         raw = raw.encode()
-
-                    if self._on_raw_message:
-                        self._on_raw_message(repr(raw))
-
-                    try:
-                        await self._dispatch(raw)
-                    except Exception as e:
-                        if self._on_error:
-                            self._on_error(e)
-                        logger.debug(f"dispatch error: {e}")
+                    recorder = self._recorder
+                    if recorder is not None:
+                        received_at = time.time()
+
+                    for packet in decoder.feed(raw):
+                        if recorder is not None:
+                            # 디코더가 헤더를 검증했으므로 서비스 코드는 항상 숫자
+                            recorder.write(received_at, int(packet[2:6]), packet)
+                        if "raw_message" in self._listeners:
+                            self._emit("raw_message", repr(packet))
+
+                        try:
+                            await self._dispatch(packet)
+                        except Exception as e:
+                            self._emit("error", e)
+                            logger.debug(f"dispatch error: {e}")
 
             except websockets.ConnectionClosed as e:
                 logger.warning(f"WebSocket 연결 종료: code={e.code}, reason={e.reason}")
-                if self._on_error:
-                    self._on_error(f"WebSocket 연결 종료: code={e.code}, reason={e.reason}")
+                self._emit("error", f"WebSocket 연결 종료: code={e.code}, reason={e.reason}")
             except Exception as e:
                 logger.error(f"WebSocket 수신 루프 오류: {e}")
-                if self._on_error:
-                    self._on_error(e)
+                self._emit("error", e)
             finally:
                 self._running = False
                 ping_task.cancel()
-                if self._on_connect:
-                    self._on_connect(False)
+                if metrics_task:
+                    metrics_task.cancel()
+                if self.metrics is not None:
+                    self.metrics.disconnected()
+                if self._recorder is not None:
+                    self._recorder.flush()
+                if self._connected_at is not None:
+                    self._disconnected_at = asyncio.get_running_loop().time()
+                if ssl_object is not None and isinstance(self._ssl_context, ResumingSSLContext):
+                    # 연결 중 받은 최신 세션 티켓을 다음 재연결에 사용
+                    self._ssl_context.save_session(url.hostname, ssl_object)
+                self._emit("connect", False)
+
+    def _record_handshake(self, ssl_object: Optional[ssl.SSLObject], open_time: float):
+        if ssl_object is None or not isinstance(self._ssl_context, ResumingSSLContext):
+            return
+        resumed = ssl_object.session_reused
+        self._ssl_context.stats.record(open_time, resumed)
+        logger.debug(f"[{self.streamer_id}] 연결 {open_time * 1000:.0f}ms ({'TLS 세션 재개' if resumed else '전체 핸드셰이크'})")
+
+    def connection_stats(self) -> dict:
+        """연결 시작 지표: TLS 세션 재개 횟수/절약 시간, DNS 캐시 적중"""
+        tls = self._ssl_context.stats.snapshot() if isinstance(self._ssl_context, ResumingSSLContext) else {}
+        return {"tls": tls, "dns": self._dns.stats()}
 
     async def _dispatch(self, msg: bytes):
-        """메시지 서비스 코드에 따라 콜백 호출"""
+        """서비스 코드 테이블로 이벤트를 찾아 리스너 호출
+
+        리스너가 없는 이벤트는 파싱하지 않고, 있으면 프레임당 한 번만 파싱합니다.
+        """
         if len(msg) < 6:
             return
 
+        frame = Frame(msg)
         try:
-            svc = get_service_code(msg)
-        except (ValueError, IndexError):
+            svc = frame.service_code
+        except ValueError:
             return
 
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.frame(svc, len(msg))
+
+        hooks = self._raw_hooks.get(svc)
+        if hooks:
+            await self._call_raw_hooks(hooks, frame)
+
         if svc == SVC_KEEPALIVE:
-            # 서버 pong 응답 → 무시 (연결 유지 확인)
+            # 서버 pong 응답 (연결 유지 확인)
             logger.debug("keepalive pong received")
+            if self._ping_sent_at:
+                if metrics is not None:
+                    metrics.keepalive(time.perf_counter_ns() - self._ping_sent_at)
+                self._ping_sent_at = 0
             return
 
-        elif svc == SVC_LOGIN:
+        if svc == SVC_LOGIN:
             # 로그인 응답 → JOIN 핸드셰이크 전송
             join_packet = self._build_join_handshake()
             await self._ws.send(join_packet)
+            self._mark_connected()
+            self._emit("connect", True)
+            return
 
-            if self._on_connect:
-                self._on_connect(True)
+        entry = EVENT_TABLE.get(svc)
+        if entry is None:
+            return
+        event, parser = entry
+        if event not in self._listeners:
+            return
 
-        elif svc == SVC_JOINCH:
-            if self._on_join_channel:
-                success = parse_join_channel(msg)
-                self._on_join_channel(success)
+        filters = self._filters.get(svc)
+        if filters and not any(accept(msg) for accept in filters):
+            self.filtered[svc] = self.filtered.get(svc, 0) + 1
+            return
 
-        elif svc == SVC_CHUSER:
-            if self._on_user_lists:
-                users = parse_user_join(msg)
-                self._on_user_lists(users)
+        if metrics is not None:
+            started = time.perf_counter_ns()
+        try:
+            data = parser(frame)
+        except Exception as e:
+            if metrics is not None:
+                metrics.parse_error(event)
+            self._emit("error", e)
+            return
+        if metrics is None:
+            await self._emit_async(event, data)
+            return
 
-        elif svc == SVC_CHATMESG:
-            if self._on_chat_message:
-                try:
-                    cm = parse_chat_message(msg)
-                    self._on_chat_message(cm)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
-
-        elif svc == SVC_SENDBALLOON:
-            if self._on_balloon:
-                try:
-                    b = parse_balloon(msg)
-                    self._on_balloon(b)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
-
-        elif svc == SVC_ADCON_EFFECT:
-            if self._on_adballoon:
-                try:
-                    ab = parse_adballoon(msg)
-                    self._on_adballoon(ab)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
-
-        elif svc in (SVC_FOLLOW_ITEM, SVC_FOLLOW_ITEM_EFFECT):
-            if self._on_subscription:
-                try:
-                    sub = parse_subscription(msg, svc)
-                    self._on_subscription(sub)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
-
-        elif svc == SVC_SENDADMINNOTICE:
-            if self._on_admin_notice:
-                try:
-                    notice = parse_admin_notice(msg)
-                    self._on_admin_notice(notice)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
-
-        elif svc == SVC_MISSION:
-            if self._on_mission:
-                try:
-                    m = parse_mission(msg)
-                    self._on_mission(m)
-                except ValueError as e:
-                    if self._on_error:
-                        self._on_error(e)
+        parsed = time.perf_counter_ns()
+        await self._emit_async(event, data)
+        metrics.observe(event, parsed - started, time.perf_counter_ns() - parsed)
+
+    async def _call_raw_hooks(self, hooks: tuple[Callable, ...], frame: Frame):
+        try:
+            header = frame.header
+        except ValueError as e:
+            self._emit("error", e)
+            return
+        payload = frame.payload
+        for callback in hooks:
+            try:
+                result = callback(header, payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._listener_failed("raw", e)
+
+    def _mark_connected(self):
+        now = asyncio.get_running_loop().time()
+        self._connected_at = now
+        if self.metrics is not None:
+            self.metrics.connected(reconnect=self._disconnected_at is not None)
+        if self._disconnected_at is not None:
+            self.reconnects += 1
+            info = ReconnectInfo(
+                attempts=self._attempts,
+                downtime=now - self._disconnected_at,
+                total_reconnects=self.reconnects,
+            )
+            self._disconnected_at = None
+            self._attempts = 0
+            logger.info(f"[{self.streamer_id}] 재연결 성공: {info.downtime:.2f}초 만에 복구 ({info.attempts}회 시도)")
+            self._emit("reconnect", info)
 
     # ─── 채팅 보내기 ───
 
-    async def send_chat(self, message: str):
-        """채팅 메시지를 전송합니다 (로그인 필요)"""
+    @property
+    def sender(self) -> SendQueue:
+        """송신 큐 (처음 접근 시 기본 설정으로 생성, stats()로 전송 지표 조회)"""
+        if self._sender is None:
+            self._sender = SendQueue(self._write_packet)
+        return self._sender
+
+    def configure_sender(
+        self,
+        rate: float = 1.0,
+        burst: int = 3,
+        maxsize: int = 100,
+        coalesce: bool = False,
+    ) -> SendQueue:
+        """송신 속도 제한 설정 (초당 rate개, 최대 burst개 연속)
+
+        coalesce=True면 토큰이 여러 개 남아 있을 때 대기 중인 패킷을 한 WebSocket 메시지로 묶어 보냅니다.
+        """
+        if self._sender is not None and len(self._sender):
+            raise Exception("전송 대기 중인 메시지가 있어 설정을 바꿀 수 없습니다")
+        self._sender = SendQueue(self._write_packet, rate, burst, maxsize, coalesce)
+        return self._sender
+
+    async def send_chat(
+        self,
+        message: str,
+        priority: int = PRIORITY_NORMAL,
+        source: str = "",
+        key: Optional[str] = None,
+    ):
+        """채팅 메시지를 전송합니다 (로그인 필요, 송신 큐를 거쳐 실제 전송될 때까지 대기)
+
+        priority: sender.PRIORITY_HIGH/NORMAL/LOW
+        source: 보내는 기능 이름 (같은 우선순위 안에서 기능별로 번갈아 전송)
+        key: 같은 key로 대기 중인 메시지가 있으면 새 내용으로 바꿔 한 번만 전송
+        """
+        await self.send_chat_nowait(message, priority, source, key)
+
+    def send_chat_nowait(
+        self,
+        message: str,
+        priority: int = PRIORITY_NORMAL,
+        source: str = "",
+        key: Optional[str] = None,
+    ) -> asyncio.Future:
+        """send_chat과 같지만 큐에 넣고 바로 반환 (전송 결과는 반환된 Future)"""
         if not self._auth_ticket:
             raise Exception("로그인하지 않은 상태에서는 채팅을 보낼 수 없습니다")
+        future = self.sender.submit(encode_chat(message), priority, source, key)
+        future.add_done_callback(self._send_done)
+        return future
+
+    def _send_done(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"chat send failed: {future.exception()}")
+
+    async def _write_packet(self, data: bytes):
         if not self._ws:
             raise Exception("WebSocket이 연결되지 않았습니다")
-
-        body = make_buffer(["\f", message, "\f", "0", "\f"])
-        header = make_header(SVC_CHATMESG, len(body), 0)
-        await self._ws.send(header + body)
+        await self._ws.send(data)
 
     # ─── 연결 해제 ───
 
     async def disconnect(self):
-        """연결을 종료합니다"""
+        """연결을 종료합니다 (run()의 재연결도 중지)"""
+        self._stopping = True
         self._running = False
         if self._ws:
             await self._ws.close()
+        self._close_streams()
+        await self._close_sender()
+
+    async def _close_sender(self):
+        if self._sender is not None:
+            await self._sender.close()
+            self._sender = None
 
     # ─── 핸드셰이크 빌드 ───
 
     def _build_login_handshake(self) -> bytes:
         """Login 핸드셰이크 패킷 생성"""
-        body = make_buffer([
-            "\f", self._auth_ticket, "\f", "\f", self._flag, "\f"
-        ])
-        header = make_header(SVC_LOGIN, len(body), 0)
-        return header + body
+        return encode_login(self._auth_ticket, self._flag)
 
     def _build_join_handshake(self) -> bytes:
-        """Join 핸드셰이크 패킷 생성"""
-        log_bytes = build_log_handshake(default_log())
-        info_bytes = build_info_handshake(default_info(self.channel_password))
-        info_packet = log_bytes + info_bytes
-
-        body = make_buffer([
-            "\f",
-            self._chat_room,
-            "\f",
-            "\f",
-            self._fan_ticket + "0",
-            "\f",
-            "",
-            "\f",
-        ]) + info_packet + b"\f"
-
-        header = make_header(SVC_JOINCH, len(body), 0)
-        return header + body
+        """Join 핸드셰이크 패킷 생성 (같은 방/티켓이면 재연결 시 재사용)"""
+        key = (self._chat_room, self._fan_ticket, self.channel_password)
+        if self._join_packet is None or self._join_packet[0] != key:
+            self._join_packet = (key, encode_join(*key))
+        return self._join_packet[1]
 
     # ─── Ping ───
 
     async def _ping_loop(self):
         """20초마다 keepalive 패킷 전송 (SOOP 서버 타임아웃 방지)"""
         try:
+            wait = PING_INTERVAL - self._ping_offset
             while self._running:
-                await asyncio.sleep(20)
+                await asyncio.sleep(wait)
+                wait = PING_INTERVAL
                 if self._ws and self._running:
-                    body = make_buffer(["\f"])
-                    header = make_header(SVC_KEEPALIVE, len(body), 0)
-                    await self._ws.send(header + body)
+                    self._ping_sent_at = time.perf_counter_ns()
+                    await self._ws.send(KEEPALIVE_PACKET)
                     logger.debug("keepalive sent")
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            if self._on_error:
-                self._on_error(e)
+            self._emit("error", e)
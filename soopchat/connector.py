@@ -0,0 +1,135 @@
+"""재연결 시작 시간 단축: TLS 세션 재개 + 채팅 서버 DNS 캐시
+
+- ResumingSSLContext: 호스트별 마지막 TLS 세션을 기억했다가 다음 연결의 핸드셰이크에 넘김
+  (asyncio가 wrap_bio로 SSLObject를 만들 때 session을 끼워 넣음)
+- DnsCache: 채팅 서버 주소를 TTL 동안 재사용 (연결 실패 시 즉시 폐기)
+
+둘 다 여러 SoopChat(SoopChatPool)이 공유하도록 만들어져 있습니다.
+재개된 연결과 전체 핸드셰이크의 연결 시간(TCP+TLS+WebSocket 업그레이드)을 따로 모아
+절약된 시간을 추정합니다 (HandshakeStats.saved).
+"""
+import asyncio
+import ipaddress
+import socket
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class HandshakeStats:
+    full: int = 0
+    resumed: int = 0
+    full_time: float = 0.0      # 전체 핸드셰이크 연결 시간 합 (초)
+    resumed_time: float = 0.0   # 세션 재개 연결 시간 합 (초)
+
+    def record(self, open_time: float, resumed: bool):
+        if resumed:
+            self.resumed += 1
+            self.resumed_time += open_time
+        else:
+            self.full += 1
+            self.full_time += open_time
+
+    @property
+    def saved(self) -> float:
+        """세션 재개로 절약한 시간 추정치 (초): (전체 평균 - 재개 평균) × 재개 횟수"""
+        if not self.full or not self.resumed:
+            return 0.0
+        per_connection = self.full_time / self.full - self.resumed_time / self.resumed
+        return max(0.0, per_connection * self.resumed)
+
+    def snapshot(self) -> dict:
+        return {
+            "full": self.full,
+            "resumed": self.resumed,
+            "full_avg_ms": self.full_time / self.full * 1000 if self.full else 0.0,
+            "resumed_avg_ms": self.resumed_time / self.resumed * 1000 if self.resumed else 0.0,
+            "saved_ms": self.saved * 1000,
+        }
+
+
+class ResumingSSLContext(ssl.SSLContext):
+    """호스트별 TLS 세션을 재사용하는 클라이언트 컨텍스트"""
+
+    def __new__(cls, protocol: int = ssl.PROTOCOL_TLS_CLIENT):
+        return super().__new__(cls, protocol)
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT):
+        self._sessions: dict[str, ssl.SSLSession] = {}
+        self.stats = HandshakeStats()
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None, session=None):
+        if session is None and not server_side and server_hostname:
+            session = self._sessions.get(server_hostname)
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
+
+    def save_session(self, hostname: str, ssl_object: ssl.SSLObject):
+        """연결에서 받은 세션(티켓)을 다음 연결용으로 보관"""
+        session = ssl_object.session
+        if session is not None:
+            self._sessions[hostname] = session
+
+    def forget_session(self, hostname: str):
+        self._sessions.pop(hostname, None)
+
+
+class DnsCache:
+    """호스트 → 주소 캐시 (TTL, 최대 크기 제한)"""
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[tuple[str, int], tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.lookup_time = 0.0   # 실제 조회에 쓴 시간 합 (초)
+
+    async def resolve(self, host: str, port: int) -> Optional[str]:
+        """host의 주소 (IP 문자열). 조회 실패 시 None (호출 쪽에서 원래 이름으로 연결)"""
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+
+        key = (host, port)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        started = time.perf_counter()
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            return None
+        finally:
+            self.lookup_time += time.perf_counter() - started
+        if not infos:
+            return None
+
+        address = infos[0][4][0]
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (address, now + self.ttl)
+        return address
+
+    def invalidate(self, host: str):
+        for key in [k for k in self._entries if k[0] == host]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "lookup_ms": self.lookup_time * 1000,
+        }
+
+
+# 프로세스 전체가 공유하는 기본 DNS 캐시
+DEFAULT_DNS_CACHE = DnsCache()
@@ -0,0 +1,352 @@
+"""로컬 가짜 SOOP 채팅 서버 (부하/재연결 테스트용)
+
+player_live_api.php 응답과 채팅 WebSocket(로그인, 입장, keepalive, 이벤트)을
+한 포트에서 제공합니다. SoopChat은 그대로 두고 ApiService 설정만 바꿔 연결합니다.
+
+    python -m soopchat.fakeserver --port 8765 --rate 5000 \\
+        --storm balloon:2000:5:30 --disconnect 30,60
+
+    api = ApiService(data_url=server.data_url, chat_scheme="ws")
+    client = SoopChat("아무_ID", api=api)
+
+server/main.py는 환경 변수 SOOP_DATA_URL, SOOP_CHAT_SCHEME으로 가리킵니다.
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import ssl
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import web, WSMsgType
+
+from .constants import SVC_KEEPALIVE, SVC_LOGIN, SVC_JOINCH, SVC_CHATMESG
+from .packets import encode_packet, KEEPALIVE_PACKET
+from .synthetic import SyntheticFrames, DEFAULT_MIX
+
+logger = logging.getLogger("soopchat.fakeserver")
+
+TICK = 0.01  # 이벤트 전송 주기 (초)
+
+
+@dataclass(slots=True)
+class Storm:
+    """특정 이벤트 폭주 구간 (기본 흐름에 더해짐)
+
+    start초부터 duration초 동안 초당 rate개, every > 0이면 every초마다 반복.
+    """
+    kind: str               # SyntheticFrames 메서드 이름 (balloon, adballoon, mission, chat ...)
+    rate: float
+    start: float = 0.0
+    duration: float = 5.0
+    every: float = 0.0
+
+    def active(self, elapsed: float) -> bool:
+        t = elapsed - self.start
+        if t < 0:
+            return False
+        if self.every > 0:
+            t %= self.every
+        return t < self.duration
+
+
+@dataclass(slots=True)
+class Scenario:
+    """가짜 서버의 동작 설정 (시간은 연결 시점 기준 초)"""
+    rate: float = 100.0                                  # 기본 흐름 초당 프레임 수
+    mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    storms: list[Storm] = field(default_factory=list)
+    users: int = 1000                                    # 입장 직후 보내는 유저 목록 크기
+    seed: int = 0
+    pack: bool = False               # 한 틱의 패킷을 WebSocket 메시지 하나로 묶어 전송
+    # n번째 연결은 disconnect_after[n]초 후 끊음 (목록을 넘으면 마지막 값 반복, 비어 있으면 유지)
+    disconnect_after: tuple[float, ...] = ()
+    abort: bool = False              # close 프레임 없이 TCP를 바로 끊음
+    reject_first: int = 0            # 처음 N번의 WebSocket 연결 거부 (503)
+    offline_after: float = 0.0       # 서버 시작 후 이 시간이 지나면 방송 종료 (0이면 계속)
+
+
+@dataclass(slots=True)
+class ServerStats:
+    connections: int = 0
+    rejected: int = 0
+    disconnects: int = 0
+    frames: int = 0
+    bytes: int = 0
+    keepalives: int = 0
+    chats_received: int = 0
+
+
+class FakeSoopServer:
+    """가짜 SOOP 서버
+
+        async with FakeSoopServer(Scenario(rate=5000)) as server:
+            api = ApiService(data_url=server.data_url, chat_scheme=server.scheme)
+            ...
+    """
+
+    def __init__(
+        self,
+        scenario: Optional[Scenario] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        chat_room: str = "123456789",
+    ):
+        self.scenario = scenario or Scenario()
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.chat_room = chat_room
+        self.stats = ServerStats()
+
+        self._runner: Optional[web.AppRunner] = None
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._started_at = 0.0
+
+    @property
+    def scheme(self) -> str:
+        return "wss" if self.ssl_context else "ws"
+
+    @property
+    def data_url(self) -> str:
+        http = "https" if self.ssl_context else "http"
+        return f"{http}://{self.host}:{self.port}/afreeca/player_live_api.php?bjId={{}}"
+
+    def _offline(self) -> bool:
+        offline_after = self.scenario.offline_after
+        return offline_after > 0 and asyncio.get_running_loop().time() - self._started_at >= offline_after
+
+    # ─── 실행 ───
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("*", "/afreeca/player_live_api.php", self._handle_api)
+        app.router.add_get("/Websocket", self._handle_ws)
+        app.router.add_get("/stats", self._handle_stats)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, ssl_context=self.ssl_context)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        self._started_at = asyncio.get_running_loop().time()
+        logger.info(f"fake SOOP server: {self.data_url}")
+
+    async def close(self):
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ─── HTTP ───
+
+    async def _handle_api(self, request: web.Request) -> web.Response:
+        if self._offline():
+            return web.json_response({"CHANNEL": {"RESULT": 0}})
+        return web.json_response({
+            "CHANNEL": {
+                "RESULT": 1,
+                "CHDOMAIN": self.host,
+                "CHPT": str(self.port - 1),   # 클라이언트는 CHPT + 1로 접속
+                "CHATNO": self.chat_room,
+            },
+        })
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        stats = self.stats
+        return web.json_response({
+            "connections": stats.connections,
+            "open": len(self._sockets),
+            "rejected": stats.rejected,
+            "disconnects": stats.disconnects,
+            "frames": stats.frames,
+            "bytes": stats.bytes,
+            "keepalives": stats.keepalives,
+            "chats_received": stats.chats_received,
+        })
+
+    # ─── WebSocket ───
+
+    async def _handle_ws(self, request: web.Request) -> web.StreamResponse:
+        stats = self.stats
+        if stats.rejected < self.scenario.reject_first:
+            stats.rejected += 1
+            raise web.HTTPServiceUnavailable()
+        if self._offline():
+            raise web.HTTPServiceUnavailable()
+
+        ws = web.WebSocketResponse(protocols=("chat",), max_msg_size=0)
+        await ws.prepare(request)
+        conn_no = stats.connections
+        stats.connections += 1
+        self._sockets.add(ws)
+
+        pump: Optional[asyncio.Task] = None
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.BINARY:
+                    continue
+                data = msg.data
+                try:
+                    svc = int(data[2:6])
+                except ValueError:
+                    continue
+
+                if svc == SVC_KEEPALIVE:
+                    stats.keepalives += 1
+                    await ws.send_bytes(KEEPALIVE_PACKET)
+                elif svc == SVC_LOGIN:
+                    await ws.send_bytes(encode_packet(SVC_LOGIN, ("fakeuser", "", "0")))
+                elif svc == SVC_JOINCH and pump is None:
+                    await ws.send_bytes(encode_packet(SVC_JOINCH, (self.chat_room, "")))
+                    pump = asyncio.create_task(self._pump(ws, request, conn_no))
+                elif svc == SVC_CHATMESG:
+                    stats.chats_received += 1
+        finally:
+            self._sockets.discard(ws)
+            if pump:
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+        return ws
+
+    def _disconnect_at(self, conn_no: int) -> float:
+        schedule = self.scenario.disconnect_after
+        if not schedule:
+            return 0.0
+        return schedule[min(conn_no, len(schedule) - 1)]
+
+    async def _pump(self, ws: web.WebSocketResponse, request: web.Request, conn_no: int):
+        """입장 이후 유저 목록 → 설정된 비율로 이벤트 전송, 예정된 시점에 연결 끊기"""
+        scenario = self.scenario
+        stats = self.stats
+        gen = SyntheticFrames(seed=scenario.seed + conn_no, users=scenario.users)
+        base = (packet for _, packet in gen.frames(1 << 62, mix=scenario.mix, user_list=False))
+
+        first = gen.user_list()
+        await ws.send_bytes(first)
+        stats.frames += 1
+        stats.bytes += len(first)
+
+        loop = asyncio.get_running_loop()
+        started = last = loop.time()
+        disconnect_at = self._disconnect_at(conn_no)
+        carry = [0.0] * (1 + len(scenario.storms))
+
+        while not ws.closed:
+            await asyncio.sleep(TICK)
+            now = loop.time()
+            dt, last = now - last, now
+            elapsed = now - started
+
+            if (disconnect_at and elapsed >= disconnect_at) or self._offline():
+                stats.disconnects += 1
+                if scenario.abort and request.transport:
+                    request.transport.abort()
+                else:
+                    await ws.close()
+                return
+
+            carry[0] += scenario.rate * dt
+            n = int(carry[0])
+            carry[0] -= n
+            packets = list(itertools.islice(base, n))
+            for i, storm in enumerate(scenario.storms, 1):
+                if not storm.active(elapsed):
+                    carry[i] = 0.0
+                    continue
+                carry[i] += storm.rate * dt
+                n = int(carry[i])
+                carry[i] -= n
+                make = getattr(gen, storm.kind)
+                packets.extend(make() for _ in range(n))
+
+            if not packets:
+                continue
+            stats.frames += len(packets)
+            if scenario.pack:
+                packets = [b"".join(packets)]
+            for packet in packets:
+                await ws.send_bytes(packet)
+                stats.bytes += len(packet)
+
+
+# ─── CLI ───
+
+def parse_storm(spec: str) -> Storm:
+    """"종류:초당개수[:지속초[:반복주기[:시작초]]]" (예: balloon:2000:5:30)"""
+    parts = spec.split(":")
+    if len(parts) < 2:
+        raise argparse.ArgumentTypeError(f"잘못된 storm 형식: {spec}")
+    storm = Storm(kind=parts[0], rate=float(parts[1]))
+    if len(parts) > 2:
+        storm.duration = float(parts[2])
+    if len(parts) > 3:
+        storm.every = float(parts[3])
+    if len(parts) > 4:
+        storm.start = float(parts[4])
+    return storm
+
+
+async def serve(server: FakeSoopServer):
+    async with server:
+        print(f"SOOP_DATA_URL={server.data_url}")
+        print(f"SOOP_CHAT_SCHEME={server.scheme}")
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 SOOP 채팅 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate", type=float, default=100.0, help="기본 흐름 초당 프레임 수")
+    parser.add_argument("--chat-only", action="store_true", help="기본 흐름을 채팅만으로")
+    parser.add_argument("--storm", type=parse_storm, action="append", default=[],
+                        help="종류:초당개수[:지속초[:반복주기[:시작초]]], 여러 번 지정 가능")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pack", action="store_true", help="틱당 패킷을 한 메시지로 묶어 전송")
+    parser.add_argument("--disconnect", default="", help="연결별 끊김 시점(초), 쉼표 구분 (마지막 값 반복)")
+    parser.add_argument("--abort", action="store_true", help="close 프레임 없이 끊기")
+    parser.add_argument("--reject-first", type=int, default=0)
+    parser.add_argument("--offline-after", type=float, default=0.0)
+    parser.add_argument("--certfile", help="지정하면 https/wss로 제공")
+    parser.add_argument("--keyfile")
+    args = parser.parse_args()
+
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+
+    scenario = Scenario(
+        rate=args.rate,
+        mix={"chat": 1.0} if args.chat_only else dict(DEFAULT_MIX),
+        storms=args.storm,
+        users=args.users,
+        seed=args.seed,
+        pack=args.pack,
+        disconnect_after=tuple(float(x) for x in args.disconnect.split(",") if x),
+        abort=args.abort,
+        reject_first=args.reject_first,
+        offline_after=args.offline_after,
+    )
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(FakeSoopServer(scenario, args.host, args.port, ssl_context)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""파싱 전 필터 (수신 루프에서 raw 필드로 판단)
+
+필터에 걸린 프레임은 decode/split도, ChatMessage/User 객체 생성도 하지 않고 버립니다.
+필요한 필드까지만 bytes로 나눠 비교하므로 거절 비용은 split 한 번 수준입니다.
+
+    # 최근 후원자의 채팅만 파싱 (user_ids는 set/dict 등 `in`이 되는 컨테이너, 실시간 반영)
+    client.add_filter(FrameFilter(SVC_CHATMESG, user_ids=recent_donors))
+    # 별풍선 100개 이상만
+    client.add_filter(FrameFilter(SVC_SENDBALLOON, min_count=100))
+    # 매니저/팬클럽 채팅만
+    client.add_filter(FrameFilter(SVC_CHATMESG, flag1=Flag1.MANAGER | Flag1.FANCLUB))
+
+같은 서비스 코드에 필터가 여러 개면 하나라도 통과하면 파싱합니다 (필터 안의 조건은 모두 만족해야 함).
+필드가 모자란 깨진 프레임은 통과시켜 파서가 오류로 보고하게 둡니다.
+"""
+import json
+from dataclasses import dataclass
+from typing import Callable, Container, Optional
+
+from .constants import (
+    SVC_CHATMESG, SVC_SENDBALLOON, SVC_ADCON_EFFECT,
+    SVC_FOLLOW_ITEM, SVC_FOLLOW_ITEM_EFFECT, SVC_MISSION,
+)
+from .utils import chat_user_id, parse_count, remove_parentheses, set_flag
+
+NO_FIELD = -1
+
+# 서비스 코드 → (유저 ID, 개수, 플래그) 필드 번호 (messages.py 파서와 같은 위치, 0은 헤더)
+RAW_LAYOUT: dict[int, tuple[int, int, int]] = {
+    SVC_CHATMESG: (2, NO_FIELD, 7),
+    SVC_SENDBALLOON: (2, 4, NO_FIELD),
+    SVC_ADCON_EFFECT: (3, 10, NO_FIELD),
+    SVC_FOLLOW_ITEM: (3, 5, NO_FIELD),
+    SVC_FOLLOW_ITEM_EFFECT: (2, 4, NO_FIELD),
+}
+
+# 서비스 코드 → 유저 ID 정규화 (messages.py 파서와 같은 함수, None이면 decode만)
+RAW_USER_ID: dict[int, Optional[Callable[[str], str]]] = {
+    SVC_CHATMESG: chat_user_id,
+    SVC_SENDBALLOON: None,
+    SVC_ADCON_EFFECT: None,
+    SVC_FOLLOW_ITEM: remove_parentheses,
+    SVC_FOLLOW_ITEM_EFFECT: remove_parentheses,
+}
+
+# 서비스 코드 → 개수가 숫자가 아닐 때 파서가 쓰는 값
+RAW_COUNT_DEFAULT: dict[int, int] = {
+    SVC_SENDBALLOON: 0,
+    SVC_ADCON_EFFECT: 0,
+    SVC_FOLLOW_ITEM: 1,
+    SVC_FOLLOW_ITEM_EFFECT: 1,
+}
+
+
+@dataclass(slots=True)
+class FrameFilter:
+    """서비스 코드 하나에 대한 파싱 전 조건
+
+    min_count: 개수(별풍선/애드벌룬/구독/미션)가 이 값 이상
+    user_ids: 유저 ID가 이 컨테이너에 있음 (None이면 검사 안 함)
+    flag1/flag2: 해당 비트 중 하나라도 켜져 있음 (채팅만, Flag1/Flag2 값)
+    """
+    svc: int
+    min_count: int = 0
+    user_ids: Optional[Container[str]] = None
+    flag1: int = 0
+    flag2: int = 0
+
+    def compile(self) -> Callable[[bytes], bool]:
+        """패킷 bytes → 통과 여부 함수"""
+        if self.svc == SVC_MISSION:
+            return self._compile_mission()
+
+        layout = RAW_LAYOUT.get(self.svc)
+        if layout is None:
+            raise ValueError(f"필터를 지원하지 않는 서비스 코드: {self.svc}")
+        uid_at, count_at, flag_at = layout
+        normalize_id = RAW_USER_ID[self.svc]
+        count_default = RAW_COUNT_DEFAULT.get(self.svc, 0)
+
+        min_count = self.min_count
+        user_ids = self.user_ids
+        flag1, flag2 = int(self.flag1), int(self.flag2)
+        if min_count and count_at == NO_FIELD:
+            raise ValueError(f"개수 조건을 쓸 수 없는 서비스 코드: {self.svc}")
+        if (flag1 or flag2) and flag_at == NO_FIELD:
+            raise ValueError(f"플래그 조건을 쓸 수 없는 서비스 코드: {self.svc}")
+
+        used = [0]
+        if min_count:
+            used.append(count_at)
+        if flag1 or flag2:
+            used.append(flag_at)
+        if user_ids is not None:
+            used.append(uid_at)
+        last = max(used)
+
+        def accept(packet: bytes) -> bool:
+            fields = packet.split(b"\f", last + 1)
+            if len(fields) <= last:
+                return True
+            # 값 해석은 파서와 같은 함수로 해서 필터와 파싱 결과가 어긋나지 않게 함
+            if min_count and parse_count(fields[count_at], count_default) < min_count:
+                return False
+            if flag1 or flag2:
+                user_flag = set_flag(fields[flag_at].decode("utf-8", "replace").split("|"))
+                if not (user_flag.value1 & flag1 or user_flag.value2 & flag2):
+                    return False
+            if user_ids is not None:
+                uid = fields[uid_at].decode("utf-8", "replace")
+                if normalize_id is not None:
+                    uid = normalize_id(uid)
+                if uid not in user_ids:
+                    return False
+            return True
+
+        return accept
+
+    def _compile_mission(self) -> Callable[[bytes], bool]:
+        if self.flag1 or self.flag2:
+            raise ValueError(f"플래그 조건을 쓸 수 없는 서비스 코드: {self.svc}")
+        min_count = self.min_count
+        user_ids = self.user_ids
+
+        def accept(packet: bytes) -> bool:
+            fields = packet.split(b"\f", 2)
+            if len(fields) < 2:
+                return True
+            try:
+                data = json.loads(fields[1])
+            except ValueError:
+                return True
+            if not isinstance(data, dict):
+                # 객체가 아닌 JSON([] 등)은 미션 데이터가 아님
+                return False
+            if min_count:
+                try:
+                    if int(data.get("gift_count", 0)) < min_count:
+                        return False
+                except (TypeError, ValueError):
+                    return False
+            if user_ids is not None and data.get("user_id", "") not in user_ids:
+                return False
+            return True
+
+        return accept
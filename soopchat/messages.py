@@ -4,49 +4,46 @@ from .types import (
     Subscription, Mission,
 )
 from .utils import (
-    remove_parentheses, set_flag,
+    remove_parentheses, chat_user_id, parse_count, set_flag, intern,
     parse_multi_user_list, parse_single_user_list,
 )
 from .constants import SVC_FOLLOW_ITEM, SVC_FOLLOW_ITEM_EFFECT
+from .frame import Frame, fields_of, parts_of
 
 
-def parse_join_channel(message: bytes) -> bool:
+def parse_join_channel(message: bytes | Frame) -> bool:
     """채널 입장 응답 파싱"""
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) > 1:
-        return msg[1] != "비밀번호가 틀렸습니다."
+        return msg[1].decode("utf-8", "replace") != "비밀번호가 틀렸습니다."
     return True
 
 
-def parse_user_join(message: bytes) -> list[UserList]:
-    """유저 입장/퇴장 파싱"""
-    msg = message.decode(errors="replace").split("\f")
+def parse_user_join(message: bytes | Frame) -> list[UserList]:
+    """유저 입장/퇴장 파싱 (모든 필드를 읽으므로 전체 decode)"""
+    msg = fields_of(message)
     if len(msg) > 10:
         return parse_multi_user_list(msg)
     return [parse_single_user_list(msg)]
 
 
-def parse_chat_message(message: bytes) -> ChatMessage:
-    """채팅 메시지 파싱 (svc=5)"""
-    msg = message.decode(errors="replace").split("\f")
+def parse_chat_message(message: bytes | Frame) -> ChatMessage:
+    """채팅 메시지 파싱 (svc=5, 텍스트 필드 대부분을 읽으므로 전체 decode)"""
+    msg = fields_of(message)
     if len(msg) < 9:
         raise ValueError("message splitting failure [5]")
 
     flags = msg[7].split("|")
     user_flag = set_flag(flags)
 
-    try:
-        sub_month = int(msg[8])
-    except (ValueError, IndexError):
-        sub_month = 0
-
+    sub_month = parse_count(msg[8], 0)
     if sub_month == -1:
         sub_month = 0
 
     return ChatMessage(
         user=User(
-            id=remove_parentheses(msg[2].strip()),
-            name=msg[6].strip(),
+            id=intern(chat_user_id(msg[2])),
+            name=intern(msg[6].strip()),
             subscribe_month=sub_month,
             flag=user_flag,
         ),
@@ -54,46 +51,40 @@ def parse_chat_message(message: bytes) -> ChatMessage:
     )
 
 
-def parse_balloon(message: bytes) -> Balloon:
+def parse_balloon(message: bytes | Frame) -> Balloon:
     """별풍선 파싱 (svc=18)
     필드: msg[1]=BJ메타, msg[2]=유저ID, msg[3]=유저닉네임, msg[4]=개수
     ※ 별풍선과 함께 보낸 채팅은 별도의 SVC_CHATMESG(5)로 수신됨
     """
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) < 5:
         raise ValueError("message splitting failure [18]")
 
-    try:
-        count = int(msg[4])
-    except (ValueError, IndexError):
-        count = 0
+    count = parse_count(msg[4], 0)
 
     return Balloon(
-        user=User(id=msg[2], name=msg[3]),
+        user=User(id=intern(msg[2].decode("utf-8", "replace")), name=intern(msg[3].decode("utf-8", "replace"))),
         count=count,
     )
 
 
-def parse_adballoon(message: bytes) -> Adballoon:
+def parse_adballoon(message: bytes | Frame) -> Adballoon:
     """애드벌룬 파싱 (svc=87)"""
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) < 11:
         raise ValueError("message splitting failure [87]")
 
-    try:
-        count = int(msg[10])
-    except (ValueError, IndexError):
-        count = 0
+    count = parse_count(msg[10], 0)
 
     return Adballoon(
-        user=User(id=msg[3], name=msg[4]),
+        user=User(id=intern(msg[3].decode("utf-8", "replace")), name=intern(msg[4].decode("utf-8", "replace"))),
         count=count,
     )
 
 
-def parse_subscription(message: bytes, svc: int) -> Subscription:
+def parse_subscription(message: bytes | Frame, svc: int) -> Subscription:
     """구독 파싱 (svc=91, 93)"""
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) < 8:
         raise ValueError("message splitting failure [91]")
 
@@ -101,41 +92,37 @@ def parse_subscription(message: bytes, svc: int) -> Subscription:
     count = 1
 
     if svc == SVC_FOLLOW_ITEM:
-        user.id = remove_parentheses(msg[3])
-        user.name = msg[4]
-        try:
-            count = int(msg[5])
-        except (ValueError, IndexError):
-            count = 1
+        user.id = intern(remove_parentheses(msg[3].decode("utf-8", "replace")))
+        user.name = intern(msg[4].decode("utf-8", "replace"))
+        count = parse_count(msg[5], 1)
     elif svc == SVC_FOLLOW_ITEM_EFFECT:
-        user.id = remove_parentheses(msg[2])
-        user.name = msg[3]
-        try:
-            count = int(msg[4])
-        except (ValueError, IndexError):
-            count = 1
+        user.id = intern(remove_parentheses(msg[2].decode("utf-8", "replace")))
+        user.name = intern(msg[3].decode("utf-8", "replace"))
+        count = parse_count(msg[4], 1)
 
     return Subscription(user=user, count=count)
 
 
-def parse_admin_notice(message: bytes) -> str:
+def parse_admin_notice(message: bytes | Frame) -> str:
     """어드민 메시지 파싱 (svc=58)"""
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) > 1:
-        return msg[1]
+        return msg[1].decode("utf-8", "replace")
     raise ValueError("message splitting failure [58]")
 
 
-def parse_mission(message: bytes) -> Mission:
+def parse_mission(message: bytes | Frame) -> Mission:
     """도전미션 파싱 (svc=121)"""
-    msg = message.decode(errors="replace").split("\f")
+    msg = parts_of(message)
     if len(msg) < 2:
         raise ValueError("message splitting failure [121]")
 
     try:
-        data = json.loads(msg[1])
+        data = json.loads(msg[1].decode("utf-8", "replace"))
     except json.JSONDecodeError:
         raise ValueError("json unmarshal failure [121]")
+    if not isinstance(data, dict):
+        raise ValueError("json unmarshal failure [121]")
 
     count = data.get("gift_count", 0)
     if isinstance(count, float):
@@ -0,0 +1,137 @@
+"""클라이언트 계측 (서비스 코드별 카운터, 파서/콜백 지연 히스토그램, keepalive RTT)
+
+SoopChat.enable_metrics()로 켜며, 꺼져 있으면 수신 루프에 비용이 없습니다.
+히스토그램은 2의 거듭제곱 버킷이라 기록은 bit_length() 한 번이고 메모리는 고정입니다.
+
+    metrics = client.enable_metrics(interval=10)   # 10초마다 "metrics" 이벤트로 스냅샷 전달
+    client.on("metrics", lambda snap: print(snap["parse"]["chat_message"]))
+    metrics.snapshot()                              # 언제든 직접 조회
+"""
+import time
+from typing import Optional
+
+# 버킷 i = [2^(i+BASE_BITS-1), 2^(i+BASE_BITS)) 나노초, 0번은 ~1µs 미만, 마지막은 ~8.6초 이상
+BASE_BITS = 10
+BUCKETS = 24
+
+
+class Histogram:
+    """나노초 단위 지연 히스토그램 (로그 버킷, 백분위는 버킷 상한으로 근사)"""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def observe(self, ns: int):
+        i = ns.bit_length() - BASE_BITS
+        if i < 0:
+            i = 0
+        elif i >= BUCKETS:
+            i = BUCKETS - 1
+        self.buckets[i] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(1 << (i + BASE_BITS), self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ns": self.total // self.count if self.count else 0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "max_ns": self.max,
+        }
+
+
+class ClientMetrics:
+    """SoopChat 하나의 계측값"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.frames: dict[int, int] = {}       # 서비스 코드 → 프레임 수
+        self.bytes: dict[int, int] = {}        # 서비스 코드 → 바이트 수
+        self.parse_errors: dict[str, int] = {}  # 이벤트(파서) → 파싱 실패 수
+        self.parse: dict[str, Histogram] = {}
+        self.callback: dict[str, Histogram] = {}
+        self.keepalive_rtt = Histogram()
+        self.last_rtt_ns = 0
+        self.reconnects = 0
+        self.connections = 0
+        self._connected_time = 0.0
+        self._connected_since: Optional[float] = None
+
+    # ─── 기록 (SoopChat 수신 루프에서 호출) ───
+
+    def frame(self, svc: int, size: int):
+        self.frames[svc] = self.frames.get(svc, 0) + 1
+        self.bytes[svc] = self.bytes.get(svc, 0) + size
+
+    def parse_error(self, event: str):
+        self.parse_errors[event] = self.parse_errors.get(event, 0) + 1
+
+    def observe(self, event: str, parse_ns: int, callback_ns: int):
+        hist = self.parse.get(event)
+        if hist is None:
+            hist = self.parse[event] = Histogram()
+            self.callback[event] = Histogram()
+        hist.observe(parse_ns)
+        self.callback[event].observe(callback_ns)
+
+    def keepalive(self, rtt_ns: int):
+        self.last_rtt_ns = rtt_ns
+        self.keepalive_rtt.observe(rtt_ns)
+
+    def connected(self, reconnect: bool):
+        self.connections += 1
+        if reconnect:
+            self.reconnects += 1
+        self._connected_since = time.monotonic()
+
+    def disconnected(self):
+        if self._connected_since is not None:
+            self._connected_time += time.monotonic() - self._connected_since
+            self._connected_since = None
+
+    # ─── 조회 ───
+
+    @property
+    def connected_time(self) -> float:
+        """연결되어 있던 누적 시간 (초, 현재 연결 포함)"""
+        total = self._connected_time
+        if self._connected_since is not None:
+            total += time.monotonic() - self._connected_since
+        return total
+
+    def snapshot(self) -> dict:
+        return {
+            "taken_at": time.time(),
+            "uptime": time.time() - self.started_at,
+            "connected": self._connected_since is not None,
+            "connected_time": self.connected_time,
+            "connections": self.connections,
+            "reconnects": self.reconnects,
+            "frames": dict(self.frames),
+            "bytes": dict(self.bytes),
+            "parse_errors": dict(self.parse_errors),
+            "parse": {event: h.snapshot() for event, h in self.parse.items()},
+            "callback": {event: h.snapshot() for event, h in self.callback.items()},
+            "keepalive_rtt": self.keepalive_rtt.snapshot(),
+            "last_rtt_ns": self.last_rtt_ns,
+        }
@@ -0,0 +1,59 @@
+"""송신 패킷 인코더
+
+패킷 = 헤더(14바이트) + 본문. 본문은 필드를 "\\f"로 감싸고 구분한 형태:
+    "\\f" + 필드1 + "\\f" + 필드2 + ... + "\\f"
+
+내용이 바뀌지 않는 패킷(keepalive, 기본 로그 핸드셰이크)은 프로세스당 한 번만 만들고,
+나머지는 필드를 모아 한 번의 join으로 만든다.
+"""
+from functools import lru_cache
+from typing import Sequence
+
+from .constants import SVC_KEEPALIVE, SVC_LOGIN, SVC_JOINCH, SVC_CHATMESG
+from .utils import (
+    make_header, default_log, default_info,
+    build_log_handshake, build_info_handshake,
+)
+
+HEADER_SIZE = 14
+
+
+def encode_packet(svc: int, fields: Sequence[str | bytes], option: int = 0) -> bytes:
+    """필드 목록으로 패킷 생성 (필드가 없으면 본문은 "\\f" 하나)"""
+    parts = [b""]
+    for f in fields:
+        parts.append(f.encode() if isinstance(f, str) else f)
+    parts.append(b"")
+    body = b"\f".join(parts)
+    return b"".join((make_header(svc, len(body), option), body))
+
+
+# keepalive는 모든 연결이 같은 바이트를 보냄
+KEEPALIVE_PACKET = encode_packet(SVC_KEEPALIVE, ())
+
+# 기본 로그 핸드셰이크 (고정값)
+DEFAULT_LOG_HANDSHAKE = build_log_handshake(default_log())
+
+
+@lru_cache(maxsize=64)
+def join_info(channel_password: str = "") -> bytes:
+    """JOIN 패킷의 로그+인포 데이터 (채널 비밀번호별로 캐시)"""
+    return DEFAULT_LOG_HANDSHAKE + build_info_handshake(default_info(channel_password))
+
+
+def encode_login(auth_ticket: str = "", flag: str = "") -> bytes:
+    """Login 핸드셰이크 패킷"""
+    return encode_packet(SVC_LOGIN, (auth_ticket, "", flag))
+
+
+def encode_join(chat_room: str, fan_ticket: str = "", channel_password: str = "") -> bytes:
+    """Join 핸드셰이크 패킷"""
+    return encode_packet(
+        SVC_JOINCH,
+        (chat_room, "", fan_ticket + "0", "", join_info(channel_password)),
+    )
+
+
+def encode_chat(message: str) -> bytes:
+    """채팅 전송 패킷"""
+    return encode_packet(SVC_CHATMESG, (message, "0"))
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import random
+from typing import Callable, Iterable, Optional
+
+from .api import ApiService
+from .client import SoopChat, DATA_EVENTS, EVENTS, PING_INTERVAL, make_ssl_context
+from .reconnect import ReconnectPolicy
+from .stream import EventStream, PriorityEventStream, LanePolicy, OVERFLOW_BLOCK
+
+logger = logging.getLogger("soopchat")
+
+
+class SoopChatPool:
+    """여러 채널을 한 프로세스/이벤트 루프에서 수신하는 클라이언트 풀
+
+    모든 채널이 TLS 컨텍스트와 HTTP 커넥션 풀을 공유하고,
+    연결(재연결 포함) 시작은 connect_interval 간격으로, keepalive는 주기 안에서 무작위로 분산됩니다.
+    각 채널은 SoopChat.run()으로 policy에 따라 자동 재연결됩니다.
+    이벤트는 하나의 스트림으로 합쳐지며 Event.streamer_id로 채널을 구분합니다.
+
+    사용법:
+        pool = SoopChatPool()
+        for sid in streamer_ids:
+            pool.add(sid)
+
+        stream = pool.events(maxsize=10000, overflow="drop_oldest")
+        await pool.start()
+        async for event in stream:
+            print(event.streamer_id, event.name, event.data)
+    """
+
+    def __init__(
+        self,
+        connect_interval: float = 0.05,
+        api: Optional[ApiService] = None,
+        policy: Optional[ReconnectPolicy] = None,
+    ):
+        self.connect_interval = connect_interval
+        self.policy = policy or ReconnectPolicy()
+        self._api = api or ApiService()
+        self._own_api = api is None
+        self._ssl_context = make_ssl_context()
+
+        self._clients: dict[str, SoopChat] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._detach: dict[str, dict[EventStream | PriorityEventStream, Callable]] = {}
+        self._streams: list[tuple[EventStream | PriorityEventStream, tuple[str, ...]]] = []
+        self._running = False
+
+        # 연결 시작 간격 조절
+        self._connect_lock = asyncio.Lock()
+        self._next_connect = 0.0
+
+    @property
+    def clients(self) -> dict[str, SoopChat]:
+        return dict(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, streamer_id: str) -> bool:
+        return streamer_id in self._clients
+
+    # ─── 채널 관리 ───
+
+    def add(self, streamer_id: str, **kwargs) -> SoopChat:
+        """채널 추가 (풀이 실행 중이면 바로 연결 시작)
+
+        kwargs는 SoopChat 생성자로 전달됩니다 (user_id, password, channel_password).
+        반환된 클라이언트에 채널별 리스너를 따로 등록할 수도 있습니다.
+        """
+        if streamer_id in self._clients:
+            return self._clients[streamer_id]
+
+        client = SoopChat(
+            streamer_id,
+            api=self._api,
+            ssl_context=self._ssl_context,
+            ping_offset=random.uniform(0, PING_INTERVAL),
+            **kwargs,
+        )
+        self._clients[streamer_id] = client
+        self._detach[streamer_id] = {
+            stream: client.attach_stream(stream, names) for stream, names in self._streams
+        }
+        if self._running:
+            self._start_client(streamer_id)
+        return client
+
+    async def remove(self, streamer_id: str):
+        """채널 연결 해제 후 풀에서 제거"""
+        client = self._clients.pop(streamer_id, None)
+        if client is None:
+            return
+        for detach in self._detach.pop(streamer_id, {}).values():
+            detach()
+        task = self._tasks.pop(streamer_id, None)
+        await client.disconnect()
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    # ─── 실행 ───
+
+    async def start(self):
+        """등록된 모든 채널 연결 시작 (connect_interval 간격으로 순차 시작)"""
+        self._running = True
+        for streamer_id in self._clients:
+            if streamer_id not in self._tasks:
+                self._start_client(streamer_id)
+
+    def _start_client(self, streamer_id: str):
+        self._tasks[streamer_id] = asyncio.create_task(self._run_client(streamer_id))
+
+    async def _run_client(self, streamer_id: str):
+        client = self._clients.get(streamer_id)
+        if client is None:
+            return
+        try:
+            # 재연결도 같은 간격 조절을 거쳐 한꺼번에 몰리지 않게 함
+            await client.run(self.policy, pace=self._pace_connect)
+        except Exception as e:
+            logger.warning(f"[{streamer_id}] 연결 종료: {e}")
+        finally:
+            self._tasks.pop(streamer_id, None)
+
+    async def _pace_connect(self):
+        """연결 시작이 한꺼번에 몰리지 않도록 connect_interval 간격 유지"""
+        loop = asyncio.get_running_loop()
+        async with self._connect_lock:
+            wait = self._next_connect - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_connect = loop.time() + self.connect_interval
+
+    async def close(self):
+        """모든 채널 연결 해제, 스트림 종료, 공유 HTTP 세션 정리"""
+        self._running = False
+        await asyncio.gather(
+            *(self.remove(sid) for sid in list(self._clients)),
+            return_exceptions=True,
+        )
+        for stream, _ in list(self._streams):
+            stream.close()
+        self._streams.clear()
+        if self._own_api:
+            await self._api.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ─── 통합 이벤트 스트림 ───
+
+    def events(
+        self,
+        maxsize: int = 10000,
+        overflow: str = OVERFLOW_BLOCK,
+        names: Optional[Iterable[str]] = None,
+    ) -> EventStream:
+        """모든 채널의 이벤트를 합친 스트림 (이후 추가되는 채널도 포함)"""
+        return self._open_stream(EventStream(maxsize=maxsize, overflow=overflow), names)
+
+    def priority_events(
+        self,
+        policies: Optional[dict[str, LanePolicy]] = None,
+        names: Optional[Iterable[str]] = None,
+    ) -> PriorityEventStream:
+        """모든 채널의 이벤트를 합친 우선순위 레인 스트림 (SoopChat.priority_events 참고)"""
+        return self._open_stream(PriorityEventStream(policies), names)
+
+    def _open_stream(self, stream, names: Optional[Iterable[str]]):
+        names = tuple(names) if names else DATA_EVENTS
+        for name in names:
+            if name not in EVENTS:
+                raise ValueError(f"알 수 없는 이벤트: {name}")
+
+        entry = (stream, names)
+        self._streams.append(entry)
+        for streamer_id, client in self._clients.items():
+            self._detach[streamer_id][stream] = client.attach_stream(stream, names)
+
+        def on_close():
+            if entry in self._streams:
+                self._streams.remove(entry)
+            for detaches in self._detach.values():
+                detach = detaches.pop(stream, None)
+                if detach:
+                    detach()
+
+        stream._on_close = on_close
+        return stream
@@ -0,0 +1,41 @@
+import random
+from dataclasses import dataclass
+
+# 재시도해도 소용없는 오류 (api.ApiService / SoopChat이 던지는 메시지)
+FATAL_MESSAGES = ("방송 중이 아닙니다", "로그인이 필요합니다", "로그인 실패")
+
+
+@dataclass(slots=True)
+class ReconnectPolicy:
+    """SoopChat.run()의 재연결 정책
+
+    연결이 stable_after초 이상 유지되다 끊기면 immediate_retry에 따라 첫 재시도는 바로,
+    이후는 base_delay * factor^n (최대 max_delay)을 기준으로 절반~전체 구간에서 무작위로 대기합니다.
+    로그인 직후 바로 끊기는 연결은 실패로 세므로 (즉시 재시도는 실패가 이어지는 동안 한 번뿐)
+    로그인만 받고 끊는 서버에 대기 없이 재접속을 반복하지 않습니다.
+    """
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    factor: float = 2.0
+    max_attempts: int = 0           # 연속 실패 허용 횟수 (0이면 무제한)
+    immediate_retry: bool = True    # 정상 연결 후 끊긴 경우 첫 재시도는 대기 없이
+    stable_after: float = 10.0      # 로그인 후 이만큼(초) 유지된 연결만 정상 연결로 보고 실패 횟수를 초기화
+    refresh_after: int = 1          # 연결 실패가 이만큼 이어지면 채팅 서버 정보를 다시 조회
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(1부터) 재시도 전 대기 시간"""
+        cap = min(self.max_delay, self.base_delay * self.factor ** (attempt - 1))
+        return random.uniform(cap / 2, cap)
+
+    def is_fatal(self, error: BaseException) -> bool:
+        message = str(error)
+        return any(m in message for m in FATAL_MESSAGES)
+
+
+@dataclass(slots=True)
+class ReconnectInfo:
+    """재연결 정보 ("reconnecting": 재시도 직전, "reconnect": 복구 성공)"""
+    attempts: int = 0         # 지금까지 시도한 횟수
+    downtime: float = 0.0     # 연결이 끊긴 뒤 경과 시간, 복구 시에는 다시 로그인될 때까지 (초)
+    total_reconnects: int = 0
+    delay: float = 0.0        # 다음 시도까지 대기 시간 ("reconnecting"에서만 사용)
@@ -0,0 +1,280 @@
+"""수신 프레임 녹화 / 재생용 캡처 파일
+
+캡처는 두 파일로 구성됩니다.
+
+    capture.bin      매직(8) + 레코드 반복
+                     레코드 = 수신시각 float64 | 서비스코드 uint16 | 길이 uint32 | 패킷 원본
+    capture.bin.idx  매직(8) + 엔트리 반복 (엔트리당 24바이트, 시간순)
+                     엔트리 = 수신시각 float64 | 레코드 오프셋 uint64 | 길이 uint32 | 서비스코드 uint16
+
+둘 다 추가 쓰기만 합니다. 수신시각은 벽시계(time.time)라 뒤로 갈 수 있으므로
+레코드에는 실제 수신시각을 그대로 남기고, 인덱스 엔트리의 시각만 직전 값보다 작아지지 않게 맞춰
+인덱스가 항상 시간순이 되게 합니다. 읽을 때는 mmap으로 열어 인덱스를 이진 탐색하므로
+몇 시간짜리 캡처도 본문을 훑지 않고 원하는 시간대/서비스 코드로 바로 이동합니다.
+
+    client.record("capture.bin")          # SoopChat 수신 루프에서 녹화
+    with CaptureReader("capture.bin") as cap:
+        for frame in cap.between(t0, t1, svc=SVC_SENDBALLOON):
+            print(frame.received_at, bytes(frame.payload))
+"""
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+DATA_MAGIC = b"SOOPCAP1"
+INDEX_MAGIC = b"SOOPIDX1"
+
+RECORD = struct.Struct("<dHI")    # 수신시각, 서비스코드, 길이
+ENTRY = struct.Struct("<dQIH2x")  # 수신시각, 오프셋, 길이, 서비스코드
+
+INDEX_SUFFIX = ".idx"
+
+
+@dataclass(slots=True)
+class CapturedFrame:
+    received_at: float    # 레코드에 남은 실제 수신시각
+    svc: int
+    payload: memoryview   # 패킷 원본 (헤더 포함), mmap 위의 뷰라 복사 없음
+
+
+class CaptureWriter:
+    """캡처 파일에 프레임을 추가 (버퍼링된 append 전용)"""
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20):
+        self.path = path
+        index_path = path + INDEX_SUFFIX
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            # 새 캡처면 남아 있던 예전 인덱스는 버림
+            with open(path, "wb") as f, open(index_path, "wb") as idx:
+                f.write(DATA_MAGIC)
+                idx.write(INDEX_MAGIC)
+            self._offset, self._last_at = len(DATA_MAGIC), 0.0
+        else:
+            self._offset, self._last_at = _recover(path)
+        self._data = open(path, "ab", buffering=buffer_size)
+        self._index = open(index_path, "ab", buffering=buffer_size >> 2)
+        self.frames = 0
+        self.bytes = 0
+
+    def write(self, received_at: float, svc: int, packet: bytes):
+        # 인덱스 시각만 시간순으로 맞춤 (레코드에는 실제 수신시각)
+        key = received_at if received_at > self._last_at else self._last_at
+        self._last_at = key
+        offset = self._offset
+        size = len(packet)
+        self._data.write(RECORD.pack(received_at, svc, size))
+        self._data.write(packet)
+        self._index.write(ENTRY.pack(key, offset, size, svc))
+        self._offset = offset + RECORD.size + size
+        self.frames += 1
+        self.bytes += size
+
+    def flush(self):
+        self._data.flush()
+        self._index.flush()
+
+    def close(self):
+        if not self._data.closed:
+            self._data.close()
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CaptureReader:
+    """mmap 기반 캡처 리더 (인덱스 이진 탐색)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        index_path = path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            rebuild_index(path)
+
+        self._data_file = open(path, "rb")
+        self._index_file = open(index_path, "rb")
+        self._data: mmap.mmap | bytes = _map(self._data_file)
+        self._index: mmap.mmap | bytes = _map(self._index_file)
+        if self._data[:len(DATA_MAGIC)] != DATA_MAGIC or self._index[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"캡처 파일 형식이 아닙니다: {path}")
+
+        # 녹화 중 끊겨 마지막 엔트리가 잘린 경우는 무시
+        self._count = (len(self._index) - len(INDEX_MAGIC)) // ENTRY.size
+        self._by_svc: Optional[dict[int, array]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int) -> tuple[float, int, int, int]:
+        return ENTRY.unpack_from(self._index, len(INDEX_MAGIC) + i * ENTRY.size)
+
+    def __getitem__(self, i: int) -> CapturedFrame:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("capture index out of range")
+        _, offset, size, svc = self._entry(i)
+        received_at = RECORD.unpack_from(self._data, offset)[0]
+        start = offset + RECORD.size
+        return CapturedFrame(received_at, svc, memoryview(self._data)[start:start + size])
+
+    def __iter__(self) -> Iterator[CapturedFrame]:
+        for i in range(self._count):
+            yield self[i]
+
+    def bisect(self, t: float) -> int:
+        """수신시각이 t 이상인 첫 엔트리 번호"""
+        return bisect_left(range(self._count), t, key=lambda i: self._entry(i)[0])
+
+    @property
+    def start_time(self) -> float:
+        return self._entry(0)[0] if self._count else 0.0
+
+    @property
+    def end_time(self) -> float:
+        return self._entry(self._count - 1)[0] if self._count else 0.0
+
+    def _service_index(self) -> dict[int, array]:
+        """서비스 코드별 엔트리 번호 목록 (인덱스 파일만 한 번 훑어서 생성)"""
+        if self._by_svc is None:
+            by_svc: dict[int, array] = {}
+            body = memoryview(self._index)[len(INDEX_MAGIC):len(INDEX_MAGIC) + self._count * ENTRY.size]
+            for i, (_, _, _, svc) in enumerate(ENTRY.iter_unpack(body)):
+                positions = by_svc.get(svc)
+                if positions is None:
+                    positions = by_svc[svc] = array("Q")
+                positions.append(i)
+            body.release()
+            self._by_svc = by_svc
+        return self._by_svc
+
+    def service_counts(self) -> dict[int, int]:
+        return {svc: len(positions) for svc, positions in self._service_index().items()}
+
+    def between(
+        self,
+        start: float = 0.0,
+        end: Optional[float] = None,
+        svc: Optional[int] = None,
+    ) -> Iterator[CapturedFrame]:
+        """[start, end) 구간의 프레임 (svc를 주면 해당 서비스 코드만)"""
+        first = self.bisect(start)
+        last = self._count if end is None else self.bisect(end)
+        if svc is None:
+            for i in range(first, last):
+                yield self[i]
+            return
+
+        positions = self._service_index().get(svc)
+        if not positions:
+            return
+        lo = bisect_left(positions, first)
+        hi = bisect_left(positions, last)
+        for j in range(lo, hi):
+            yield self[positions[j]]
+
+    def close(self):
+        for m in (self._data, self._index):
+            if not isinstance(m, bytes):
+                try:
+                    m.close()
+                except BufferError:
+                    # 아직 살아있는 payload 뷰가 있으면 매핑은 뷰가 사라질 때 해제됨
+                    pass
+        self._data_file.close()
+        self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _map(f) -> mmap.mmap | bytes:
+    if os.fstat(f.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _append_entries(f, idx, offset: int, last_at: float) -> tuple[int, float, int]:
+    """본문 offset부터 온전한 레코드를 훑어 인덱스 엔트리를 추가
+
+    (마지막 온전한 레코드의 끝, 마지막 인덱스 시각, 추가한 엔트리 수) 반환
+    """
+    data_size = os.fstat(f.fileno()).st_size
+    count = 0
+    f.seek(offset)
+    while True:
+        head = f.read(RECORD.size)
+        if len(head) < RECORD.size:
+            break
+        received_at, svc, size = RECORD.unpack(head)
+        end = offset + RECORD.size + size
+        if end > data_size:
+            break
+        f.seek(end)
+        if received_at > last_at:
+            last_at = received_at
+        idx.write(ENTRY.pack(last_at, offset, size, svc))
+        offset = end
+        count += 1
+    return offset, last_at, count
+
+
+def _recover(path: str) -> tuple[int, float]:
+    """녹화 중 끊긴 캡처를 이어 쓸 수 있게 본문과 인덱스를 맞춤
+
+    - 본문에 없는 레코드를 가리키는 엔트리와 잘린 마지막 엔트리는 인덱스에서 잘라냄
+    - 인덱스에 아직 없는 본문 레코드는 인덱스에 추가 (인덱스가 없거나 깨졌으면 처음부터)
+    - 잘린 마지막 레코드는 본문에서 잘라냄
+    (본문 끝 오프셋, 마지막 인덱스 시각) 반환
+    """
+    index_path = path + INDEX_SUFFIX
+    with open(path, "r+b") as f, open(index_path, "a+b") as idx:
+        if f.read(len(DATA_MAGIC)) != DATA_MAGIC:
+            raise ValueError(f"캡처 파일 형식이 아닙니다: {path}")
+        data_size = os.fstat(f.fileno()).st_size
+        idx.seek(0)
+        if idx.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            idx.truncate(0)
+            idx.write(INDEX_MAGIC)
+            idx.flush()
+        count = (os.fstat(idx.fileno()).st_size - len(INDEX_MAGIC)) // ENTRY.size
+
+        # 본문에 온전히 남아 있는 마지막 엔트리 찾기 (본문보다 인덱스가 먼저 flush됐을 수 있음)
+        offset, last_at = len(DATA_MAGIC), 0.0
+        while count:
+            idx.seek(len(INDEX_MAGIC) + (count - 1) * ENTRY.size)
+            key, entry_offset, size, _ = ENTRY.unpack(idx.read(ENTRY.size))
+            if entry_offset + RECORD.size + size <= data_size:
+                offset, last_at = entry_offset + RECORD.size + size, key
+                break
+            count -= 1
+        idx.truncate(len(INDEX_MAGIC) + count * ENTRY.size)
+
+        offset, last_at, _ = _append_entries(f, idx, offset, last_at)
+        if offset < data_size:
+            f.truncate(offset)
+    return offset, last_at
+
+
+def rebuild_index(path: str) -> int:
+    """본문을 훑어 인덱스 파일을 다시 만듦 (인덱스 유실/손상 시). 엔트리 수 반환
+
+    예전 캡처처럼 수신시각이 뒤로 간 레코드가 있어도 인덱스는 시간순이 되도록 맞춥니다.
+    """
+    with open(path, "rb") as f, open(path + INDEX_SUFFIX, "wb") as idx:
+        if f.read(len(DATA_MAGIC)) != DATA_MAGIC:
+            raise ValueError(f"캡처 파일 형식이 아닙니다: {path}")
+        idx.write(INDEX_MAGIC)
+        _, _, count = _append_entries(f, idx, len(DATA_MAGIC), 0.0)
+    return count
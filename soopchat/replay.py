@@ -0,0 +1,212 @@
+"""오프라인 리플레이 (녹화/합성 프레임을 실제 수신 경로로 재생)
+
+프레임을 SoopChat._dispatch → parse_* → 리스너 순서 그대로 통과시키고
+서비스 코드별 처리량과 파서/콜백 지연 백분위를 측정합니다. 방송 없이 성능을 재는 용도.
+
+    replayer = Replayer()                          # 모든 이벤트에 빈 리스너를 단 클라이언트
+    result = await replayer.replay(SyntheticFrames().frames(100_000))
+    print(result.format())
+
+    # 녹화 파일을 실제 속도로 재생 (speed=2.0이면 두 배속)
+    result = await replayer.replay(capture_frames("capture.bin"), speed=1.0)
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .client import SoopChat, EVENT_TABLE, DATA_EVENTS
+from .recorder import CaptureReader
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: list[int], p: float) -> int:
+    """정렬된 목록의 p 백분위 (nearest-rank)"""
+    if not sorted_values:
+        return 0
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+@dataclass(slots=True)
+class ServiceStats:
+    """서비스 코드 하나의 리플레이 통계 (지연은 나노초)"""
+    svc: int
+    event: str = ""
+    frames: int = 0
+    bytes: int = 0
+    errors: int = 0
+    parse_ns: list[int] = field(default_factory=list)      # _dispatch 시간 - 콜백 시간
+    callback_ns: list[int] = field(default_factory=list)   # 리스너 전체 실행 시간
+
+    def summary(self, elapsed: float) -> dict:
+        parse = sorted(self.parse_ns)
+        callback = sorted(self.callback_ns)
+        return {
+            "svc": self.svc,
+            "event": self.event,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "frames_per_sec": self.frames / elapsed if elapsed else 0.0,
+            "parse_ns": {f"p{p}": percentile(parse, p) for p in PERCENTILES} | {"max": parse[-1] if parse else 0},
+            "callback_ns": {f"p{p}": percentile(callback, p) for p in PERCENTILES} | {"max": callback[-1] if callback else 0},
+        }
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    elapsed: float = 0.0
+    services: dict[int, ServiceStats] = field(default_factory=dict)
+
+    @property
+    def frames(self) -> int:
+        return sum(s.frames for s in self.services.values())
+
+    @property
+    def bytes(self) -> int:
+        return sum(s.bytes for s in self.services.values())
+
+    def summary(self) -> dict:
+        """JSON으로 저장해 릴리스 간 비교하기 좋은 형태"""
+        return {
+            "elapsed": self.elapsed,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "frames_per_sec": self.frames / self.elapsed if self.elapsed else 0.0,
+            "services": [self.services[svc].summary(self.elapsed) for svc in sorted(self.services)],
+        }
+
+    def format(self) -> str:
+        s = self.summary()
+        lines = [
+            f"{s['frames']} frames, {s['bytes'] / 1024:.0f} KiB in {s['elapsed']:.3f}s "
+            f"({s['frames_per_sec']:,.0f} frames/s)",
+            f"{'svc':>4} {'event':<14} {'frames':>9} {'fps':>10} {'err':>5} "
+            f"{'parse p50/p99 (us)':>20} {'callback p50/p99 (us)':>22}",
+        ]
+        for row in s["services"]:
+            parse, callback = row["parse_ns"], row["callback_ns"]
+            lines.append(
+                f"{row['svc']:>4} {row['event'] or '-':<14} {row['frames']:>9} "
+                f"{row['frames_per_sec']:>10,.0f} {row['errors']:>5} "
+                f"{parse['p50'] / 1000:>9.2f}/{parse['p99'] / 1000:<10.2f} "
+                f"{callback['p50'] / 1000:>10.2f}/{callback['p99'] / 1000:<10.2f}"
+            )
+        return "\n".join(lines)
+
+
+class _NullSocket:
+    """리플레이 중 _dispatch가 보내는 패킷(JOIN 등)을 버리는 가짜 WebSocket"""
+
+    def __init__(self):
+        self.sent = 0
+
+    async def send(self, data):
+        self.sent += 1
+
+    async def close(self):
+        pass
+
+
+def capture_frames(
+    path: str,
+    start: float = 0.0,
+    end: Optional[float] = None,
+    svc: Optional[int] = None,
+) -> Iterable[tuple[float, bytes]]:
+    """녹화 파일의 프레임을 (수신시각, 패킷)으로 읽음"""
+    with CaptureReader(path) as reader:
+        for frame in reader.between(start, end, svc):
+            yield frame.received_at, frame.payload.tobytes()
+
+
+class Replayer:
+    """프레임을 SoopChat의 실제 디스패치 경로로 재생하며 측정
+
+    client를 생략하면 모든 데이터 이벤트에 빈 리스너를 단 클라이언트를 만듭니다
+    (리스너가 없는 이벤트는 파싱을 건너뛰므로).
+    """
+
+    def __init__(self, client: Optional[SoopChat] = None):
+        if client is None:
+            client = SoopChat("replay")
+            for event in DATA_EVENTS:
+                client.on(event, _noop)
+        self.client = client
+
+    async def replay(
+        self,
+        frames: Iterable[tuple[float, bytes]],
+        speed: Optional[float] = None,
+    ) -> ReplayResult:
+        """frames를 재생 (speed=None이면 최대 속도, 1.0이면 녹화된 간격 그대로)"""
+        client = self.client
+        result = ReplayResult()
+        services = result.services
+        callback_ns = 0
+        errors = 0
+
+        emit_async = client._emit_async
+
+        async def timed_emit(event, *args):
+            nonlocal callback_ns
+            t = time.perf_counter_ns()
+            await emit_async(event, *args)
+            callback_ns += time.perf_counter_ns() - t
+
+        def on_error(_):
+            nonlocal errors
+            errors += 1
+
+        saved_ws = client._ws
+        client._ws = _NullSocket()
+        client._emit_async = timed_emit
+        client.on("error", on_error)
+
+        loop = asyncio.get_running_loop()
+        perf_counter_ns = time.perf_counter_ns
+        dispatch = client._dispatch
+        first_ts = None
+        started = time.perf_counter()
+        try:
+            for received_at, packet in frames:
+                if speed:
+                    if first_ts is None:
+                        first_ts, t0 = received_at, loop.time()
+                    wait = t0 + (received_at - first_ts) / speed - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                try:
+                    svc = int(packet[2:6])
+                except ValueError:
+                    svc = -1
+                stats = services.get(svc)
+                if stats is None:
+                    entry = EVENT_TABLE.get(svc)
+                    stats = services[svc] = ServiceStats(svc, entry[0] if entry else "")
+
+                callback_ns = 0
+                errors = 0
+                t = perf_counter_ns()
+                await dispatch(packet)
+                total = perf_counter_ns() - t
+
+                stats.frames += 1
+                stats.bytes += len(packet)
+                stats.errors += errors
+                stats.parse_ns.append(total - callback_ns)
+                if callback_ns:
+                    stats.callback_ns.append(callback_ns)
+        finally:
+            result.elapsed = time.perf_counter() - started
+            del client._emit_async
+            client.off("error", on_error)
+            client._ws = saved_ws
+        return result
+
+
+def _noop(*args):
+    pass
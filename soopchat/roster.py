@@ -0,0 +1,139 @@
+"""시청자 명단 (SVC_CHUSER 입장/퇴장으로 갱신)
+
+유저 ID → 플래그 정수 하나(flag1 | flag2 << 32)만 저장하고,
+관심 있는 플래그 비트(매니저, 팬클럽, 구독자, 열혈팬)별 인원은 입장/퇴장마다 바로 갱신합니다.
+maxsize를 넘으면 가장 오래된 항목부터 밀어내 메모리를 제한합니다.
+유저 ID는 "(2)" 같은 접미사를 떼고 저장합니다. 전체 목록은 접미사가 붙은 채로,
+단일 입장/퇴장은 뗀 채로 파싱되므로 여기서 맞춰야 같은 유저로 보입니다.
+
+    roster = client.track_roster()
+    ...
+    roster.counts()        # {"manager": 3, "fanclub": 120, "subscriber": 45, "top_fan": 8}
+    "viewer123" in roster
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from .types import Flag1, Flag2, User, UserFlag, UserList
+from .utils import intern, remove_parentheses
+
+FLAG2_SHIFT = 32
+
+# 이름 → 묶은 플래그 정수에서의 비트
+DEFAULT_TRACKED: dict[str, int] = {
+    "manager": Flag1.MANAGER,
+    "fanclub": Flag1.FANCLUB,
+    "subscriber": Flag1.SUBSCRIBER,
+    "top_fan": Flag1.TOP_FAN,
+}
+
+
+def pack_flag(flag: UserFlag) -> int:
+    return flag.value1 | flag.value2 << FLAG2_SHIFT
+
+
+def unpack_flag(packed: int) -> UserFlag:
+    return UserFlag(packed & 0xFFFFFFFF, packed >> FLAG2_SHIFT)
+
+
+def flag2_bit(flag: Flag2) -> int:
+    """Flag2 비트를 tracked 설정에 쓸 수 있는 값으로 변환"""
+    return int(flag) << FLAG2_SHIFT
+
+
+@dataclass(slots=True)
+class RosterSnapshot:
+    size: int
+    counts: dict[str, int]
+    evicted: int = 0
+    taken_at: float = 0.0
+    user_ids: list[str] = field(default_factory=list)
+
+
+class Roster:
+    """현재 채팅방 인원 (입장/퇴장 O(1), 플래그별 인원 집계)"""
+
+    def __init__(self, maxsize: int = 500_000, tracked: Optional[dict[str, int]] = None):
+        self.maxsize = maxsize
+        self.tracked = tuple((tracked or DEFAULT_TRACKED).items())
+        self._users: dict[str, int] = {}
+        self._counts: dict[str, int] = {name: 0 for name, _ in self.tracked}
+        self.evicted = 0   # maxsize 때문에 밀려난 누적 인원
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._users)
+
+    def flag(self, user_id: str) -> Optional[UserFlag]:
+        packed = self._users.get(user_id)
+        return None if packed is None else unpack_flag(packed)
+
+    def get(self, user_id: str) -> Optional[User]:
+        packed = self._users.get(user_id)
+        return None if packed is None else User(id=user_id, flag=unpack_flag(packed))
+
+    def _count(self, packed: int, delta: int):
+        counts = self._counts
+        for name, bit in self.tracked:
+            if packed & bit:
+                counts[name] += delta
+
+    # ─── 갱신 ───
+
+    def join(self, user_id: str, flag: UserFlag):
+        user_id = intern(remove_parentheses(user_id))
+        packed = pack_flag(flag)
+        users = self._users
+        old = users.get(user_id)
+        if old is not None:
+            if old == packed:
+                return
+            self._count(old, -1)
+        elif len(users) >= self.maxsize:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 입장
+            oldest = next(iter(users))
+            self._count(users.pop(oldest), -1)
+            self.evicted += 1
+        users[user_id] = packed
+        self._count(packed, 1)
+
+    def leave(self, user_id: str):
+        packed = self._users.pop(remove_parentheses(user_id), None)
+        if packed is not None:
+            self._count(packed, -1)
+
+    def apply(self, entries: Iterable[UserList]):
+        """parse_user_join 결과 반영 ("user_lists" 리스너로 사용)"""
+        for entry in entries:
+            user = entry.user
+            if not user.id:
+                continue
+            if entry.status:
+                self.join(user.id, user.flag)
+            else:
+                self.leave(user.id)
+
+    def clear(self):
+        self._users.clear()
+        for name in self._counts:
+            self._counts[name] = 0
+
+    # ─── 조회 ───
+
+    def counts(self) -> dict[str, int]:
+        return dict(self._counts)
+
+    def snapshot(self, include_users: bool = False) -> RosterSnapshot:
+        return RosterSnapshot(
+            size=len(self._users),
+            counts=dict(self._counts),
+            evicted=self.evicted,
+            taken_at=time.time(),
+            user_ids=list(self._users) if include_users else [],
+        )
@@ -0,0 +1,235 @@
+"""송신 큐 (토큰 버킷 속도 제한, 우선순위, 소스별 공정 순서, 병합)
+
+send_chat을 여러 기능(미션 안내, 감사 메시지 등)이 동시에 호출해도
+서버 제한을 넘지 않도록 rate/burst에 맞춰 내보냅니다.
+
+- 우선순위: PRIORITY_HIGH → NORMAL → LOW 순서로 꺼냄
+- 공정성: 같은 우선순위 안에서는 source(기능 이름)별로 번갈아 꺼냄
+- 병합: 같은 key로 대기 중인 메시지가 있으면 새 내용으로 바꾸고 한 번만 보냄,
+        coalesce=True면 토큰이 여러 개 남아 있을 때 대기 패킷을 WebSocket 메시지 하나로 묶어 보냄
+
+    await client.send_chat("감사합니다!", source="thanks")
+    client.send_chat_nowait("미션 진행 중 3/10", key="mission-status", priority=PRIORITY_LOW)
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from .metrics import Histogram
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 모아 둘 수 있는 토큰 버킷"""
+
+    __slots__ = ("rate", "burst", "tokens", "_updated")
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate > 0, burst >= 1 이어야 합니다")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> int:
+        self._refill()
+        return int(self.tokens)
+
+    def wait_time(self) -> float:
+        """토큰 하나가 생길 때까지 남은 시간 (초)"""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, n: int = 1):
+        self._refill()
+        self.tokens -= n
+
+
+@dataclass(slots=True)
+class _Pending:
+    packet: bytes
+    future: asyncio.Future
+    enqueued_at: int      # perf_counter_ns
+    key: Optional[str] = None
+
+
+class SendQueue:
+    """패킷 송신 큐 (send 함수 하나를 여러 기능이 공유)"""
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable],
+        rate: float = 1.0,
+        burst: int = 3,
+        maxsize: int = 100,
+        coalesce: bool = False,
+    ):
+        self._send = send
+        self.bucket = TokenBucket(rate, burst)
+        self.maxsize = maxsize
+        self.coalesce = coalesce
+
+        # 우선순위별 {source: deque}, OrderedDict 순서를 돌려가며 공정하게 꺼냄
+        self._lanes: list[OrderedDict[str, deque[_Pending]]] = [
+            OrderedDict() for _ in (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+        ]
+        self._keyed: dict[str, _Pending] = {}
+        self._size = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # 지표
+        self.enqueued = 0
+        self.delivered = 0
+        self.failed = 0
+        self.rejected = 0     # 큐가 가득 차 거절
+        self.merged = 0       # 같은 key로 합쳐진 메시지
+        self.socket_sends = 0
+        self.latency = Histogram()   # 큐 대기 + 전송 시간 (나노초)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def submit(
+        self,
+        packet: bytes,
+        priority: int = PRIORITY_NORMAL,
+        source: str = "",
+        key: Optional[str] = None,
+    ) -> asyncio.Future:
+        """패킷을 큐에 넣고 전송 완료 Future를 반환"""
+        if self._closed:
+            raise Exception("송신 큐가 닫혔습니다")
+
+        if key is not None:
+            pending = self._keyed.get(key)
+            if pending is not None and not pending.future.done():
+                pending.packet = packet
+                self.merged += 1
+                return pending.future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self._size >= self.maxsize:
+            self.rejected += 1
+            future.set_exception(Exception("송신 큐가 가득 찼습니다"))
+            return future
+
+        pending = _Pending(packet, future, time.perf_counter_ns(), key)
+        if key is not None:
+            self._keyed[key] = pending
+        lane = self._lanes[min(max(priority, PRIORITY_HIGH), PRIORITY_LOW)]
+        queue = lane.get(source)
+        if queue is None:
+            queue = lane[source] = deque()
+        queue.append(pending)
+        self._size += 1
+        self.enqueued += 1
+
+        if self._task is None:
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+        return future
+
+    async def send(self, packet: bytes, **kwargs):
+        """큐에 넣고 실제로 전송될 때까지 대기"""
+        await self.submit(packet, **kwargs)
+
+    def _pop(self) -> Optional[_Pending]:
+        for lane in self._lanes:
+            while lane:
+                source, queue = next(iter(lane.items()))
+                pending = queue.popleft()
+                if queue:
+                    lane.move_to_end(source)
+                else:
+                    del lane[source]
+                self._size -= 1
+                if pending.key is not None and self._keyed.get(pending.key) is pending:
+                    del self._keyed[pending.key]
+                if pending.future.done():   # 호출 쪽에서 취소
+                    continue
+                return pending
+        return None
+
+    async def _run(self):
+        bucket = self.bucket
+        while not self._closed:
+            if not self._size:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            wait = bucket.wait_time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            batch = []
+            limit = bucket.available() if self.coalesce else 1
+            while len(batch) < limit:
+                pending = self._pop()
+                if pending is None:
+                    break
+                batch.append(pending)
+            if not batch:
+                continue
+
+            bucket.take(len(batch))
+            data = batch[0].packet if len(batch) == 1 else b"".join(p.packet for p in batch)
+            try:
+                await self._send(data)
+            except Exception as e:
+                self.failed += len(batch)
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+
+            self.socket_sends += 1
+            now = time.perf_counter_ns()
+            for pending in batch:
+                self.delivered += 1
+                self.latency.observe(now - pending.enqueued_at)
+                if not pending.future.done():
+                    pending.future.set_result(None)
+
+    async def close(self):
+        """워커 중지, 대기 중인 메시지는 실패 처리"""
+        self._closed = True
+        self._wakeup.set()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        while True:
+            pending = self._pop()
+            if pending is None:
+                break
+            self.failed += 1
+            pending.future.set_exception(Exception("송신 큐가 닫혔습니다"))
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._size,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "merged": self.merged,
+            "socket_sends": self.socket_sends,
+            "tokens": self.bucket.available(),
+            "latency": self.latency.snapshot(),
+        }
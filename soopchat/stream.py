@@ -0,0 +1,289 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# 큐가 가득 찼을 때의 처리 방식
+OVERFLOW_BLOCK = "block"              # 자리가 날 때까지 수신 루프 대기 (backpressure)
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # 가장 오래된 이벤트를 버리고 추가
+OVERFLOW_DROP_NEWEST = "drop_newest"  # 새 이벤트를 버림
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST)
+
+
+@dataclass(slots=True)
+class Event:
+    name: str                 # "balloon", "chat_message", ...
+    data: Any = None          # 파싱된 이벤트 객체 (Balloon, ChatMessage, ...)
+    received_at: float = 0.0  # 수신 시각 (time.time())
+    streamer_id: str = ""     # 이벤트가 발생한 채널
+
+
+class EventStream:
+    """수신 루프와 이벤트 소비를 분리하는 bounded 큐
+
+    사용법:
+        async for event in client.events(maxsize=1000, overflow="drop_oldest"):
+            if event.name == "balloon":
+                ...
+
+    클라이언트 연결이 끝나거나 close()가 호출되면 남은 이벤트를 모두 꺼낸 뒤 반복이 끝납니다.
+    """
+
+    def __init__(self, maxsize: int = 1000, overflow: str = OVERFLOW_BLOCK):
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"알 수 없는 overflow 정책: {overflow}")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._items: deque[Event] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._closed = False
+        self._on_close: Optional[Callable] = None
+
+        # 지표
+        self.max_depth = 0
+        self.dropped = 0
+        self.delivered = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, event: Event):
+        """이벤트 추가 (overflow 정책 적용)"""
+        if self._closed:
+            return
+
+        items = self._items
+        if len(items) >= self.maxsize:
+            if self.overflow == OVERFLOW_BLOCK:
+                while len(items) >= self.maxsize and not self._closed:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+                if self._closed:
+                    return
+            elif self.overflow == OVERFLOW_DROP_OLDEST:
+                items.popleft()
+                self.dropped += 1
+            else:
+                self.dropped += 1
+                return
+
+        items.append(event)
+        if len(items) > self.max_depth:
+            self.max_depth = len(items)
+        self._not_empty.set()
+
+    def close(self):
+        """스트림 종료 (남은 이벤트는 계속 꺼낼 수 있음)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+        if self._on_close:
+            self._on_close()
+
+    def metrics(self) -> dict:
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "overflow": self.overflow,
+            "dropped": self.dropped,
+            "delivered": self.delivered,
+        }
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        items = self._items
+        while not items:
+            if self._closed:
+                raise StopAsyncIteration
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        event = items.popleft()
+        self.delivered += 1
+        self._not_full.set()
+        return event
+
+
+# ─── 우선순위 레인 ───
+
+LANE_PAID = "paid"        # 유료 이벤트: 항상 먼저, 절대 버리지 않음
+LANE_NOTICE = "notice"
+LANE_CHAT = "chat"
+LANE_ROSTER = "roster"
+LANE_ORDER = (LANE_PAID, LANE_NOTICE, LANE_CHAT, LANE_ROSTER)
+
+# 이벤트 이름 → 레인 (목록에 없는 이벤트는 paid 레인: 연결/재연결 같은 드문 제어 이벤트)
+EVENT_LANES = {
+    "balloon": LANE_PAID,
+    "adballoon": LANE_PAID,
+    "mission": LANE_PAID,
+    "subscription": LANE_PAID,
+    "admin_notice": LANE_NOTICE,
+    "join_channel": LANE_NOTICE,
+    "chat_message": LANE_CHAT,
+    "user_lists": LANE_ROSTER,
+}
+
+
+@dataclass(slots=True)
+class LanePolicy:
+    """레인 하나의 크기와 버림 정책
+
+    paid 레인은 overflow="block"만 허용 (가득 차면 버리지 않고 수신 루프를 대기시킴).
+    max_age > 0이면 꺼낼 때 이보다 오래된 이벤트(received_at 기준, 초)는 버립니다.
+    """
+    maxsize: int = 1000
+    overflow: str = OVERFLOW_DROP_OLDEST
+    max_age: float = 0.0
+
+
+def default_lane_policies() -> dict[str, LanePolicy]:
+    return {
+        LANE_PAID: LanePolicy(maxsize=10000, overflow=OVERFLOW_BLOCK),
+        LANE_NOTICE: LanePolicy(maxsize=100),
+        LANE_CHAT: LanePolicy(maxsize=1000),
+        LANE_ROSTER: LanePolicy(maxsize=200),
+    }
+
+
+class PriorityEventStream:
+    """레인별 큐를 가진 이벤트 스트림 (EventStream과 같은 방식으로 사용)
+
+    소비자는 항상 앞 레인(paid → notice → chat → roster)부터 꺼내므로
+    채팅이 수천 개 밀려 있어도 별풍선/애드벌룬/미션/구독은 바로 나옵니다.
+    뒤 레인은 LanePolicy에 따라 버려지고 레인별 shed 카운터에 기록됩니다.
+
+        stream = client.priority_events(policies={"chat": LanePolicy(maxsize=200, max_age=5)})
+        async for event in stream:
+            ...
+    """
+
+    def __init__(self, policies: Optional[dict[str, LanePolicy]] = None):
+        merged = default_lane_policies()
+        merged.update(policies or {})
+        for lane, policy in merged.items():
+            if lane not in LANE_ORDER:
+                raise ValueError(f"알 수 없는 레인: {lane}")
+            if policy.maxsize <= 0:
+                raise ValueError("maxsize는 1 이상이어야 합니다")
+            if policy.overflow not in OVERFLOW_POLICIES:
+                raise ValueError(f"알 수 없는 overflow 정책: {policy.overflow}")
+        paid = merged[LANE_PAID]
+        if paid.overflow != OVERFLOW_BLOCK or paid.max_age:
+            raise ValueError("paid 레인은 버릴 수 없습니다 (overflow='block', max_age=0)")
+
+        self.policies = merged
+        self._lanes: list[tuple[str, deque[Event], LanePolicy]] = [
+            (lane, deque(), merged[lane]) for lane in LANE_ORDER
+        ]
+        self._by_name = {lane: items for lane, items, _ in self._lanes}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._closed = False
+        self._on_close: Optional[Callable] = None
+
+        # 지표 (레인별)
+        self.shed = {lane: 0 for lane in LANE_ORDER}
+        self.delivered = {lane: 0 for lane in LANE_ORDER}
+        self.max_depth = {lane: 0 for lane in LANE_ORDER}
+
+    @property
+    def depth(self) -> int:
+        return sum(len(items) for _, items, _ in self._lanes)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, event: Event):
+        if self._closed:
+            return
+
+        lane = EVENT_LANES.get(event.name, LANE_PAID)
+        items = self._by_name[lane]
+        policy = self.policies[lane]
+        if len(items) >= policy.maxsize:
+            if policy.overflow == OVERFLOW_BLOCK:
+                while len(items) >= policy.maxsize and not self._closed:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+                if self._closed:
+                    return
+            elif policy.overflow == OVERFLOW_DROP_OLDEST:
+                items.popleft()
+                self.shed[lane] += 1
+            else:
+                self.shed[lane] += 1
+                return
+
+        items.append(event)
+        if len(items) > self.max_depth[lane]:
+            self.max_depth[lane] = len(items)
+        self._not_empty.set()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+        if self._on_close:
+            self._on_close()
+
+    def metrics(self) -> dict:
+        return {
+            lane: {
+                "depth": len(items),
+                "max_depth": self.max_depth[lane],
+                "maxsize": policy.maxsize,
+                "overflow": policy.overflow,
+                "shed": self.shed[lane],
+                "delivered": self.delivered[lane],
+            }
+            for lane, items, policy in self._lanes
+        }
+
+    def _pop(self) -> Optional[Event]:
+        now = 0.0
+        for lane, items, policy in self._lanes:
+            if policy.max_age and items:
+                now = now or time.time()
+                while items and now - items[0].received_at > policy.max_age:
+                    items.popleft()
+                    self.shed[lane] += 1
+            if items:
+                self.delivered[lane] += 1
+                if policy.overflow == OVERFLOW_BLOCK:
+                    self._not_full.set()
+                return items.popleft()
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        while True:
+            event = self._pop()
+            if event is not None:
+                return event
+            if self._closed:
+                raise StopAsyncIteration
+            self._not_empty.clear()
+            await self._not_empty.wait()
@@ -0,0 +1,139 @@
+"""합성 프레임 생성기 (리플레이/벤치마크용)
+
+실제 서버가 보내는 것과 같은 형태의 패킷을 만듭니다. seed가 같으면 같은 순서의 프레임이 나옵니다.
+
+    gen = SyntheticFrames(seed=1)
+    for received_at, packet in gen.frames(100_000, rate=2000):
+        ...
+"""
+import json
+import random
+from typing import Iterator, Optional
+
+from .constants import (
+    SVC_CHUSER, SVC_CHATMESG, SVC_SENDBALLOON, SVC_ADCON_EFFECT,
+    SVC_FOLLOW_ITEM, SVC_MISSION,
+)
+from .packets import encode_packet
+from .types import Flag1
+
+# 종류별 기본 비율 (채팅 위주의 일반적인 방송)
+DEFAULT_MIX = {
+    "chat": 0.85,
+    "user_join": 0.08,
+    "balloon": 0.04,
+    "adballoon": 0.01,
+    "subscription": 0.01,
+    "mission": 0.01,
+}
+
+# 일반 시청자 / 팬클럽 / 구독자 / 매니저 / 열혈팬 플래그 ("flag1|flag2")
+_VIEWER = Flag1.QUICK_VIEW
+FLAGS = tuple(f"{int(flag1)}|{flag2}" for flag1, flag2 in (
+    (_VIEWER, 0),
+    (_VIEWER | Flag1.FANCLUB, 0),
+    (_VIEWER | Flag1.FANCLUB | Flag1.SUBSCRIBER, 163840),
+    (_VIEWER | Flag1.MANAGER, 0),
+    (_VIEWER | Flag1.FANCLUB | Flag1.TOP_FAN, 163840),
+))
+
+CHAT_TEXTS = (
+    "ㅋㅋㅋㅋㅋ", "안녕하세요~", "오늘 방송 너무 재밌어요 ㅋㅋㅋ", "?", "ㄷㄷㄷ",
+    "이거 어떻게 하는 거예요?", "하이요", "GG", "와 대박", "👍👍👍",
+)
+
+
+class SyntheticFrames:
+    """채팅, 별풍선, 애드벌룬, 구독, 도전미션, 유저 입장/목록 패킷 생성"""
+
+    def __init__(self, seed: int = 0, users: int = 1000, streamer_id: str = "streamer"):
+        self.rng = random.Random(seed)
+        self.streamer_id = streamer_id
+        self.users = [(f"viewer{i:06d}", f"시청자{i}") for i in range(users)]
+
+    def _user(self) -> tuple[str, str]:
+        return self.rng.choice(self.users)
+
+    def chat(self, text: Optional[str] = None) -> bytes:
+        uid, nick = self._user()
+        return encode_packet(SVC_CHATMESG, (
+            text or self.rng.choice(CHAT_TEXTS), f"{uid}(2)", "0", "1", "0",
+            nick, self.rng.choice(FLAGS), str(self.rng.choice((-1, 0, 3, 12))), "0", "",
+        ))
+
+    def balloon(self, count: Optional[int] = None) -> bytes:
+        uid, nick = self._user()
+        count = count or self.rng.choice((1, 10, 50, 100, 1000))
+        return encode_packet(SVC_SENDBALLOON, (
+            self.streamer_id, uid, nick, str(count), "0", "0", "1", "", "0", "",
+        ))
+
+    def adballoon(self, count: Optional[int] = None) -> bytes:
+        uid, nick = self._user()
+        count = count or self.rng.choice((100, 500, 1000))
+        return encode_packet(SVC_ADCON_EFFECT, (
+            self.streamer_id, "0", uid, nick, "1", "0", "0", "0", "0", str(count), "0", "",
+        ))
+
+    def subscription(self, months: Optional[int] = None) -> bytes:
+        uid, nick = self._user()
+        months = months or self.rng.randint(1, 24)
+        return encode_packet(SVC_FOLLOW_ITEM, (
+            self.streamer_id, "0", f"{uid}(2)", nick, str(months), "0", "0",
+        ))
+
+    def mission(self, count: Optional[int] = None) -> bytes:
+        uid, nick = self._user()
+        data = {
+            "type": "GIFT",
+            "user_id": uid,
+            "user_nick": nick,
+            "title": "도전미션",
+            "gift_count": count or self.rng.choice((10, 100, 500)),
+        }
+        return encode_packet(SVC_MISSION, (json.dumps(data, ensure_ascii=False),))
+
+    def user_join(self, status: Optional[bool] = None) -> bytes:
+        """단일 유저 입장/퇴장"""
+        uid, nick = self._user()
+        if status is None:
+            status = self.rng.random() < 0.6
+        if status:
+            return encode_packet(SVC_CHUSER, ("1", f"{uid}(2)", nick, self.rng.choice(FLAGS), ""))
+        return encode_packet(SVC_CHUSER, ("-1", f"{uid}(2)", nick, ""))
+
+    def user_list(self, n: Optional[int] = None) -> bytes:
+        """입장 직후 받는 전체 유저 목록"""
+        users = self.users if n is None else self.users[:n]
+        fields = ["1"]
+        for i, (uid, nick) in enumerate(users):
+            fields += (f"{uid}(2)", nick, FLAGS[i % len(FLAGS)])
+        return encode_packet(SVC_CHUSER, fields)
+
+    def frames(
+        self,
+        count: int,
+        mix: Optional[dict[str, float]] = None,
+        rate: float = 1000.0,
+        start: float = 0.0,
+        user_list: bool = True,
+    ) -> Iterator[tuple[float, bytes]]:
+        """(수신시각, 패킷)을 count개 생성 (rate: 초당 프레임 수)
+
+        user_list=True면 첫 프레임은 전체 유저 목록 (실제 입장 직후와 같은 순서)
+        """
+        mix = mix or DEFAULT_MIX
+        makers = [getattr(self, kind) for kind in mix]
+        weights = list(mix.values())
+        interval = 1.0 / rate if rate > 0 else 0.0
+
+        i = 0
+        if user_list and count > 0:
+            yield start, self.user_list()
+            i = 1
+        choices = self.rng.choices
+        while i < count:
+            # 한 번에 여러 개씩 뽑아 rng 호출 비용을 줄임
+            for make in choices(makers, weights, k=min(1024, count - i)):
+                yield start + i * interval, make()
+                i += 1
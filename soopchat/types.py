@@ -1,103 +1,132 @@
 from dataclasses import dataclass, field
+from enum import IntFlag
 from typing import Optional
 
 
-@dataclass
-class Flag1:
-    admin: bool = False
-    hidden: bool = False
-    bj: bool = False
-    dumb: bool = False
-    guest: bool = False
-    fanclub: bool = False
-    auto_manager: bool = False
-    manager_list: bool = False
-    manager: bool = False
-    female: bool = False
-    auto_dumb: bool = False
-    dumb_blind: bool = False
-    dobae_blind: bool = False
-    dobae_blind2: bool = False
-    exit_user: bool = False
-    mobile: bool = False
-    top_fan: bool = False
-    realname: bool = False
-    no_direct: bool = False
-    global_app: bool = False
-    quick_view: bool = False
-    sptr_sticker: bool = False
-    chromecast: bool = False
-    subscriber: bool = False
-    noti_vod_balloon: bool = False
-    noti_top_fan: bool = False
-
-
-@dataclass
-class Flag2:
-    global_pc: bool = False
-    clan: bool = False
-    top_clan: bool = False
-    top20: bool = False
-    game_god: bool = False
-    atag_allow: bool = False
-    no_super_chat: bool = False
-    no_recv_chat: bool = False
-    flash: bool = False
-    lg_game: bool = False
-    employee: bool = False
-    clean_ati: bool = False
-    police: bool = False
-    admin_chat: bool = False
-    pc: bool = False
-    specify: bool = False
-
-
-@dataclass
+class Flag1(IntFlag):
+    ADMIN = 1 << 0
+    HIDDEN = 1 << 1
+    BJ = 1 << 2
+    DUMB = 1 << 3
+    GUEST = 1 << 4
+    FANCLUB = 1 << 5
+    AUTO_MANAGER = 1 << 6
+    MANAGER_LIST = 1 << 7
+    MANAGER = 1 << 8
+    FEMALE = 1 << 9
+    AUTO_DUMB = 1 << 10
+    DUMB_BLIND = 1 << 11
+    DOBAE_BLIND = 1 << 12
+    DOBAE_BLIND2 = 1 << 24
+    EXIT_USER = 1 << 13
+    MOBILE = 1 << 14
+    TOP_FAN = 1 << 15
+    REALNAME = 1 << 16
+    NO_DIRECT = 1 << 17
+    GLOBAL_APP = 1 << 18
+    QUICK_VIEW = 1 << 19
+    SPTR_STICKER = 1 << 20
+    CHROMECAST = 1 << 21
+    SUBSCRIBER = 1 << 28
+    NOTI_VOD_BALLOON = 1 << 30
+    NOTI_TOP_FAN = 1 << 31
+
+
+class Flag2(IntFlag):
+    GLOBAL_PC = 1 << 0
+    CLAN = 1 << 1
+    TOP_CLAN = 1 << 2
+    TOP20 = 1 << 3
+    GAME_GOD = 1 << 4
+    ATAG_ALLOW = 1 << 5
+    NO_SUPER_CHAT = 1 << 6
+    NO_RECV_CHAT = 1 << 7
+    FLASH = 1 << 8
+    LG_GAME = 1 << 9
+    EMPLOYEE = 1 << 10
+    CLEAN_ATI = 1 << 11
+    POLICE = 1 << 12
+    ADMIN_CHAT = 1 << 13
+    PC = 1 << 14
+    SPECIFY = 1 << 15
+
+
+def _add_bit_properties(flag_cls):
+    """멤버마다 소문자 bool 속성 추가 (flag.manager, flag.top_fan ...)"""
+    for member in flag_cls:
+        bit = member.value
+        setattr(flag_cls, member.name.lower(), property(lambda self, bit=bit: bool(int(self) & bit)))
+
+
+_add_bit_properties(Flag1)
+_add_bit_properties(Flag2)
+
+
+@dataclass(frozen=True, slots=True)
 class UserFlag:
-    flag1: Flag1 = field(default_factory=Flag1)
-    flag2: Flag2 = field(default_factory=Flag2)
+    """유저 플래그
 
+    원시 정수 두 개만 저장하고, 비트는 접근할 때 계산한다.
+        flag.flag1.manager, flag.flag2.pc
+        flag.value1 & Flag1.MANAGER
 
-@dataclass
+    불변 객체라 같은 값의 인스턴스를 여러 유저가 공유한다 (utils.set_flag).
+    """
+    value1: int = 0
+    value2: int = 0
+
+    @property
+    def flag1(self) -> Flag1:
+        return Flag1(self.value1)
+
+    @property
+    def flag2(self) -> Flag2:
+        return Flag2(self.value2)
+
+
+NO_FLAG = UserFlag()
+
+
+@dataclass(slots=True)
 class User:
     id: str = ""
     name: str = ""
     subscribe_month: int = 0
-    flag: UserFlag = field(default_factory=UserFlag)
+    flag: UserFlag = NO_FLAG
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     user: User = field(default_factory=User)
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UserList:
     user: User = field(default_factory=User)
     status: bool = True  # True=입장, False=퇴장
 
 
-@dataclass
+@dataclass(slots=True)
 class Balloon:
     user: User = field(default_factory=User)
     count: int = 0
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Adballoon:
     user: User = field(default_factory=User)
     count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     user: User = field(default_factory=User)
     count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Mission:
     user: User = field(default_factory=User)
     title: str = ""
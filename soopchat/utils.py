@@ -1,16 +1,20 @@
 import re
-from .types import UserFlag, Flag1, Flag2, User, UserList
+import sys
+from .types import UserFlag, Flag1, Flag2, User, UserList, NO_FLAG
+
+# 유저 ID/닉네임은 같은 유저가 채팅·입장·후원마다 반복하므로 intern 해서 공유
+intern = sys.intern
+
+# (flag1, flag2) → 공유 UserFlag. 실제 조합 수는 많지 않지만 상한은 둔다
+_FLAG_CACHE: dict[tuple[int, int], UserFlag] = {}
+_FLAG_CACHE_MAX = 4096
 
 
 def make_header(svc: int, payload_len: int, option: int = 0) -> bytes:
     """바이너리 프로토콜 헤더 생성
     [0x1B, 0x09] + 4자리 서비스코드 + 6자리 페이로드길이 + 2자리 옵션
     """
-    header = bytes([0x1B, 0x09])
-    header += f"{svc:04d}".encode()
-    header += f"{payload_len:06d}".encode()
-    header += f"{option:02d}".encode()
-    return header
+    return b"\x1b\x09%04d%06d%02d" % (svc, payload_len, option)
 
 
 def make_buffer(parts: list[str]) -> bytes:
@@ -31,56 +35,25 @@ def remove_parentheses(s: str) -> str:
     return s
 
 
+def chat_user_id(s: str) -> str:
+    """채팅 유저 ID 정규화 (앞뒤 공백을 지운 뒤 괄호 제거)"""
+    return remove_parentheses(s.strip())
+
+
+def parse_count(raw: str | bytes, default: int) -> int:
+    """개수 필드를 정수로 변환 (숫자가 아니면 default)"""
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
 def get_flag1(flag: int) -> Flag1:
-    return Flag1(
-        admin=bool(flag & (1 << 0)),
-        hidden=bool(flag & (1 << 1)),
-        bj=bool(flag & (1 << 2)),
-        dumb=bool(flag & (1 << 3)),
-        guest=bool(flag & (1 << 4)),
-        fanclub=bool(flag & (1 << 5)),
-        auto_manager=bool(flag & (1 << 6)),
-        manager_list=bool(flag & (1 << 7)),
-        manager=bool(flag & (1 << 8)),
-        female=bool(flag & (1 << 9)),
-        auto_dumb=bool(flag & (1 << 10)),
-        dumb_blind=bool(flag & (1 << 11)),
-        dobae_blind=bool(flag & (1 << 12)),
-        dobae_blind2=bool(flag & (1 << 24)),
-        exit_user=bool(flag & (1 << 13)),
-        mobile=bool(flag & (1 << 14)),
-        top_fan=bool(flag & (1 << 15)),
-        realname=bool(flag & (1 << 16)),
-        no_direct=bool(flag & (1 << 17)),
-        global_app=bool(flag & (1 << 18)),
-        quick_view=bool(flag & (1 << 19)),
-        sptr_sticker=bool(flag & (1 << 20)),
-        chromecast=bool(flag & (1 << 21)),
-        subscriber=bool(flag & (1 << 28)),
-        noti_vod_balloon=bool(flag & (1 << 30)),
-        noti_top_fan=bool(flag & (1 << 31)),
-    )
+    return Flag1(flag)
 
 
 def get_flag2(flag: int) -> Flag2:
-    return Flag2(
-        global_pc=bool(flag & (1 << 0)),
-        clan=bool(flag & (1 << 1)),
-        top_clan=bool(flag & (1 << 2)),
-        top20=bool(flag & (1 << 3)),
-        game_god=bool(flag & (1 << 4)),
-        atag_allow=bool(flag & (1 << 5)),
-        no_super_chat=bool(flag & (1 << 6)),
-        no_recv_chat=bool(flag & (1 << 7)),
-        flash=bool(flag & (1 << 8)),
-        lg_game=bool(flag & (1 << 9)),
-        employee=bool(flag & (1 << 10)),
-        clean_ati=bool(flag & (1 << 11)),
-        police=bool(flag & (1 << 12)),
-        admin_chat=bool(flag & (1 << 13)),
-        pc=bool(flag & (1 << 14)),
-        specify=bool(flag & (1 << 15)),
-    )
+    return Flag2(flag)
 
 
 def set_flag(flags: list[str]) -> UserFlag:
@@ -90,7 +63,13 @@ def set_flag(flags: list[str]) -> UserFlag:
         f2 = int(flags[1]) if len(flags) > 1 else 0
     except (ValueError, IndexError):
         f1, f2 = 0, 0
-    return UserFlag(flag1=get_flag1(f1), flag2=get_flag2(f2))
+    key = (f1, f2)
+    user_flag = _FLAG_CACHE.get(key)
+    if user_flag is None:
+        user_flag = UserFlag(f1, f2)
+        if len(_FLAG_CACHE) < _FLAG_CACHE_MAX:
+            _FLAG_CACHE[key] = user_flag
+    return user_flag
 
 
 def parse_multi_user_list(msg: list[str]) -> list[UserList]:
@@ -104,7 +83,7 @@ def parse_multi_user_list(msg: list[str]) -> list[UserList]:
         flags = msg[i + 2].split("|") if len(msg) > i + 2 else ["0", "0"]
         user_flag = set_flag(flags)
         users.append(UserList(
-            user=User(id=msg[i], name=msg[i + 1], flag=user_flag),
+            user=User(id=intern(msg[i]), name=intern(msg[i + 1]), flag=user_flag),
             status=True,
         ))
         i += 3
@@ -114,7 +93,7 @@ def parse_multi_user_list(msg: list[str]) -> list[UserList]:
 def parse_single_user_list(msg: list[str]) -> UserList:
     """단일 유저 입장/퇴장 파싱"""
     status = msg[1] == "1" if len(msg) > 1 else True
-    user_flag = UserFlag()
+    user_flag = NO_FLAG
 
     if status and len(msg) > 4:
         flags = msg[4].split("|")
@@ -122,8 +101,8 @@ def parse_single_user_list(msg: list[str]) -> UserList:
 
     return UserList(
         user=User(
-            id=remove_parentheses(msg[2]) if len(msg) > 2 else "",
-            name=msg[3] if len(msg) > 3 else "",
+            id=intern(remove_parentheses(msg[2])) if len(msg) > 2 else "",
+            name=intern(msg[3]) if len(msg) > 3 else "",
             flag=user_flag,
         ),
         status=status,
@@ -154,23 +133,18 @@ def default_info(password: str = "") -> dict:
 
 def build_log_handshake(log_data: dict) -> bytes:
     """로그 핸드셰이크 데이터 생성"""
-    result = b"log" + bytes([0x11])
-    # 로그 값 생성
-    log_bytes = b""
+    parts = [b"log\x11\x06&"]
     for k, v in log_data.items():
         if v:
-            entry = bytes([0x06]) + k.encode() + bytes([0x06, 0x3D, 0x06]) + v.encode() + bytes([0x06, 0x26])
-            log_bytes += entry
-    result += bytes([0x06, 0x26]) + log_bytes
-    result += bytes([0x12])
-    return result
+            parts += (b"\x06", k.encode(), b"\x06=\x06", v.encode(), b"\x06&")
+    parts.append(b"\x12")
+    return b"".join(parts)
 
 
 def build_info_handshake(info_data: dict) -> bytes:
     """인포 핸드셰이크 데이터 생성"""
-    result = b""
+    parts = []
     for k, v in info_data.items():
         if v:
-            entry = k.encode() + bytes([0x11]) + v.encode() + bytes([0x12])
-            result += entry
-    return result
+            parts += (k.encode(), b"\x11", v.encode(), b"\x12")
+    return b"".join(parts)